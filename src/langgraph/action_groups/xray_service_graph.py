@@ -11,6 +11,8 @@ CONSTRAINTS:
 - Timeout: 2 seconds
 """
 
+from heapq import nsmallest
+from operator import itemgetter
 from typing import Any, Dict
 from .common import (
     get_aws_client,
@@ -18,12 +20,50 @@ from .common import (
     success_response,
     partial_response,
     failed_response,
-    sort_by_name,
-    truncate_data,
     parse_iso_timestamp,
     validate_time_window,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to botocore's json parser
+    orjson = None
+
+# Shared empty mapping for missing statistics blocks (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+
+def _use_fast_json_parser(client):
+    """
+    Parse this client's JSON response bodies with orjson.
+    
+    Scoped to the given client's response parser (botocore's global json
+    module is left untouched). Mirrors BaseJSONParser._parse_body_as_json:
+    empty body -> {}, undecodable body -> botocore's own handling.
+    
+    Args:
+        client: Boto3 client using a JSON protocol
+    
+    Returns:
+        The same client
+    """
+    parser = getattr(client, '_response_parser', None)
+    if orjson is None or parser is None or not hasattr(parser, '_parse_body_as_json'):
+        return client
+    
+    fallback = parser._parse_body_as_json
+    
+    def _parse_body_as_json(body_contents):
+        if not body_contents:
+            return {}
+        try:
+            return orjson.loads(body_contents)
+        except orjson.JSONDecodeError:
+            return fallback(body_contents)
+    
+    parser._parse_body_as_json = _parse_body_as_json
+    return client
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -92,7 +132,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         end_dt = parse_iso_timestamp(end_time)
         
         # Create X-Ray client
-        xray = get_aws_client('xray')
+        xray = _use_fast_json_parser(get_aws_client('xray'))
         
         # Get service graph
         response = xray.get_service_graph(
@@ -113,14 +153,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         services = []
         for service in response.get('Services', []):
             # Extract summary statistics
-            summary_stats = service.get('SummaryStatistics', {})
+            summary_stats = service.get('SummaryStatistics') or _EMPTY
+            total = summary_stats.get('TotalCount') or 0
+            throttles = (summary_stats.get('ErrorStatistics') or _EMPTY).get('ThrottleCount', 0)
+            faults = (summary_stats.get('FaultStatistics') or _EMPTY).get('TotalCount', 0)
             
             service_data = {
                 'name': service.get('Name', 'Unknown'),
                 'type': service.get('Type', 'Unknown'),
-                'request_count': summary_stats.get('TotalCount', 0),
-                'error_rate': summary_stats.get('ErrorStatistics', {}).get('ThrottleCount', 0) / max(summary_stats.get('TotalCount', 1), 1),
-                'fault_rate': summary_stats.get('FaultStatistics', {}).get('TotalCount', 0) / max(summary_stats.get('TotalCount', 1), 1),
+                'request_count': total,
+                'error_rate': throttles / total if total else 0.0,
+                'fault_rate': faults / total if total else 0.0,
                 'response_time_p95': summary_stats.get('TotalResponseTime', 0),
             }
             
@@ -130,32 +173,35 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             services.append(service_data)
         
-        # Sort services by name (deterministic)
-        services = sort_by_name(services, name_key='name')
+        # Top-K services by name (deterministic, sorted ascending)
+        services = nsmallest(limit, services, key=itemgetter('name'))
         
-        # Truncate services
-        services = truncate_data(services, max_items=limit)
-        
-        # Parse edges (connections between services)
+        # Parse edges (connections between services), bounded while building
+        max_edges = limit * 2
         edges = []
         for service in response.get('Services', []):
+            if len(edges) >= max_edges:
+                break
+            
             source_name = service.get('Name', 'Unknown')
             
             for edge in service.get('Edges', []):
-                edge_summary = edge.get('SummaryStatistics', {})
+                if len(edges) >= max_edges:
+                    break
+                
+                edge_summary = edge.get('SummaryStatistics') or _EMPTY
+                edge_total = edge_summary.get('TotalCount') or 0
+                edge_throttles = (edge_summary.get('ErrorStatistics') or _EMPTY).get('ThrottleCount', 0)
                 
                 edge_data = {
                     'source': source_name,
                     'target': edge.get('ReferenceId', 'Unknown'),
-                    'request_count': edge_summary.get('TotalCount', 0),
-                    'error_rate': edge_summary.get('ErrorStatistics', {}).get('ThrottleCount', 0) / max(edge_summary.get('TotalCount', 1), 1),
+                    'request_count': edge_total,
+                    'error_rate': edge_throttles / edge_total if edge_total else 0.0,
                 }
                 
                 edges.append(edge_data)
         
-        # Truncate edges
-        edges = truncate_data(edges, max_items=limit * 2)
-        
         # Return structured graph data
         graph_data = {
             'services': services,
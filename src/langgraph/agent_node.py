@@ -19,15 +19,22 @@ PHASE 8.1 GOVERNANCE:
 - Best-effort delivery
 """
 
+import asyncio
 import hashlib
 import json
+import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Dict, Optional, Union
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Sequence, Union
 
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from langgraph.utils.runnable import RunnableCallable
 
 from .state import (
     GraphState,
@@ -39,11 +46,18 @@ from .state import (
 )
 from .trace_emitter import emit_trace_event_async
 
+# Module logger; the level comes from the application (lambda_handler sets
+# it from LOG_LEVEL). DEBUG output includes raw Bedrock responses.
+logger = logging.getLogger(__name__)
+
 # Phase 8.2: Guardrail support
 import os
 GUARDRAIL_ID = os.environ.get('GUARDRAIL_ID')
 GUARDRAIL_VERSION = os.environ.get('GUARDRAIL_VERSION', '1')
 
+# Latency-optimized inference (opt-in; only some models/regions support it)
+BEDROCK_LATENCY_OPTIMIZED = os.environ.get('BEDROCK_LATENCY_OPTIMIZED', 'false').lower() == 'true'
+
 
 # ============================================================================
 # CONSTANTS
@@ -117,6 +131,40 @@ ERROR_CODE_MAPPING = {
     "Exception": "UNKNOWN_ERROR",
 }
 
+
+class ErrorCode(IntEnum):
+    """
+    Canonical error codes as small ints for bitmask classification.
+    
+    State, traces and StructuredError keep the string name (JSON);
+    the enum is only used on the in-process classification path.
+    """
+    BEDROCK_THROTTLING = 0
+    RATE_LIMIT_EXCEEDED = 1
+    DATA_SOURCE_UNAVAILABLE = 2
+    TIMEOUT = 3
+    INVALID_INPUT = 4
+    MISSING_REQUIRED_FIELD = 5
+    SCHEMA_VALIDATION_FAILED = 6
+    OUTPUT_VALIDATION_FAILED = 7
+    LOW_CONFIDENCE = 8
+    BUDGET_EXCEEDED = 9
+    INTERNAL_ERROR = 10
+    UNKNOWN_ERROR = 11
+
+
+# Bit i set <=> ErrorCode(i) is in RETRYABLE_ERROR_CODES
+_RETRYABLE_MASK = 0
+for _code in ErrorCode:
+    if _code.name in RETRYABLE_ERROR_CODES:
+        _RETRYABLE_MASK |= 1 << _code
+del _code
+
+# Exception name -> ErrorCode (same table as ERROR_CODE_MAPPING)
+_ERROR_CODE_ENUM_MAPPING = {
+    name: ErrorCode[code] for name, code in ERROR_CODE_MAPPING.items()
+}
+
 # Model pricing (USD per 1K tokens)
 MODEL_PRICING = {
     "anthropic.claude-3-5-sonnet-20241022-v2:0": {
@@ -135,42 +183,107 @@ MODEL_PRICING = {
 # BEDROCK CLIENT
 # ============================================================================
 
-bedrock_agent_runtime = boto3.client("bedrock-agent-runtime")
+# Retries are owned by this wrapper (retry_count + RETRYABLE_ERROR_CODES),
+# so botocore must not retry underneath it. Timeouts are bounded by the
+# per-agent budget; a larger pool lets parallel agents reuse connections.
+# TCP_NODELAY needs no hook: botocore builds its pool on urllib3's default
+# socket options, which already set TCP_NODELAY, and tcp_keepalive=True
+# appends SO_KEEPALIVE to that list rather than replacing it.
+BEDROCK_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 1, "mode": "standard"},
+    max_pool_connections=50,
+    connect_timeout=2.0,
+    read_timeout=30.0,
+    tcp_keepalive=True,
+)
+
+bedrock_agent_runtime = boto3.client(
+    "bedrock-agent-runtime",
+    config=BEDROCK_CLIENT_CONFIG,
+)
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def is_retryable_error(error_code: str) -> bool:
+class _LazyJSON:
+    """
+    Defers JSON serialization of a log argument until it is formatted.
+    
+    Disabled log levels never call __str__, so large Bedrock responses
+    are only serialized when DEBUG logging is actually on.
+    """
+    __slots__ = ("value", "limit")
+    
+    def __init__(self, value: object, limit: int) -> None:
+        self.value = value
+        self.limit = limit
+    
+    def __str__(self) -> str:
+        return orjson.dumps(
+            self.value, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()[:self.limit]
+
+
+class _LazyKeys:
+    """Defers list(mapping.keys()) for log formatting."""
+    __slots__ = ("mapping",)
+    
+    def __init__(self, mapping: Dict) -> None:
+        self.mapping = mapping
+    
+    def __str__(self) -> str:
+        return str(list(self.mapping.keys()))
+
+
+def is_retryable_error(error_code: Union[str, ErrorCode]) -> bool:
     """
     Check if error code is retryable.
     
+    ErrorCode values are classified with a single bitmask test; strings
+    (including raw AWS exception names) fall back to RETRYABLE_ERROR_CODES.
+    
     Args:
         error_code: Error code from exception or mapping
     
     Returns:
         True if retryable, False otherwise
     """
+    if type(error_code) is ErrorCode:
+        return bool(_RETRYABLE_MASK >> error_code & 1)
     return error_code in RETRYABLE_ERROR_CODES
 
 
-def map_exception_to_error_code(exception: Exception) -> str:
+def classify_exception(exception: Exception) -> ErrorCode:
     """
-    Map AWS exception to canonical error code.
+    Map AWS exception to canonical ErrorCode.
     
     Args:
         exception: Exception from Bedrock invocation
     
     Returns:
-        Canonical error code from ErrorCode enum
+        ErrorCode member (UNKNOWN_ERROR if unmapped)
     """
     if isinstance(exception, ClientError):
         error_code = exception.response.get("Error", {}).get("Code", "Exception")
-        return ERROR_CODE_MAPPING.get(error_code, "UNKNOWN_ERROR")
+        return _ERROR_CODE_ENUM_MAPPING.get(error_code, ErrorCode.UNKNOWN_ERROR)
     
     exception_name = type(exception).__name__
-    return ERROR_CODE_MAPPING.get(exception_name, "UNKNOWN_ERROR")
+    return _ERROR_CODE_ENUM_MAPPING.get(exception_name, ErrorCode.UNKNOWN_ERROR)
+
+
+def map_exception_to_error_code(exception: Exception) -> str:
+    """
+    Map AWS exception to canonical error code.
+    
+    Args:
+        exception: Exception from Bedrock invocation
+    
+    Returns:
+        Canonical error code from ErrorCode enum
+    """
+    return classify_exception(exception).name
 
 
 def extract_cost_metadata(
@@ -216,10 +329,10 @@ def extract_cost_metadata(
     # Get pricing for model
     pricing = MODEL_PRICING.get(model_id, MODEL_PRICING["default"])
     
-    # Calculate cost (deterministic)
-    input_cost = (input_tokens / 1000) * pricing["input"]
-    output_cost = (output_tokens / 1000) * pricing["output"]
-    estimated_cost = input_cost + output_cost
+    # Calculate cost (deterministic): pricing is per 1K tokens, scale once
+    estimated_cost = (
+        input_tokens * pricing["input"] + output_tokens * pricing["output"]
+    ) / 1000
     
     return {
         "inputTokens": input_tokens,
@@ -263,11 +376,12 @@ def compute_deterministic_hash(
     Returns:
         SHA256 hex digest
     """
+    ai = agent_input
     canonical = {
         "agent_input": {
-            "incident_id": agent_input.incident_id,
-            "evidence_bundle": agent_input.evidence_bundle,
-            "execution_id": agent_input.execution_id,
+            "incident_id": ai.incident_id,
+            "evidence_bundle": ai.evidence_bundle,
+            "execution_id": ai.execution_id,
             # timestamp EXCLUDED - execution-time metadata
             # session_id EXCLUDED - execution-time metadata
         },
@@ -278,9 +392,21 @@ def compute_deterministic_hash(
     # Sort keys recursively for determinism
     canonical_json = json.dumps(canonical, sort_keys=True)
     
+    # Single one-shot digest: hashlib hands the whole buffer to OpenSSL's
+    # EVP SHA-256 (SHA-NI / ARMv8 SHA2 where available)
     return hashlib.sha256(canonical_json.encode()).hexdigest()
 
 
+# Checked in order; first empty field is reported
+_REQUIRED_INPUT_FIELDS = (
+    "incident_id",
+    "evidence_bundle",
+    "timestamp",
+    "execution_id",
+    "session_id",
+)
+
+
 def validate_agent_input(agent_input: AgentInput) -> None:
     """
     Validate AgentInput before Bedrock invocation.
@@ -298,20 +424,44 @@ def validate_agent_input(agent_input: AgentInput) -> None:
     Raises:
         ValueError: If validation fails
     """
-    if not agent_input.incident_id:
-        raise ValueError("incident_id is required")
+    for field_name in _REQUIRED_INPUT_FIELDS:
+        if not getattr(agent_input, field_name):
+            raise ValueError(f"{field_name} is required")
+
+
+# Single-entry cache: (agent_input, serialized static prefix). One
+# AgentInput is shared by every agent and retry of an execution.
+_input_text_prefix_cache: tuple = (None, "")
+
+
+def build_input_text(agent_input: AgentInput, budget_remaining: float) -> str:
+    """
+    Build the Bedrock inputText payload.
     
-    if not agent_input.evidence_bundle:
-        raise ValueError("evidence_bundle is required")
+    The static part (incidentId, evidenceBundle, timestamp, executionId)
+    is serialized once per AgentInput and reused; only budgetRemaining is
+    serialized per call. Output is byte-identical to json.dumps of the
+    full dict, so the prompt prefix stays stable across agents.
     
-    if not agent_input.timestamp:
-        raise ValueError("timestamp is required")
+    Args:
+        agent_input: Agent input envelope
+        budget_remaining: Remaining budget (USD)
     
-    if not agent_input.execution_id:
-        raise ValueError("execution_id is required")
+    Returns:
+        JSON string for inputText
+    """
+    global _input_text_prefix_cache
+    cached_input, prefix = _input_text_prefix_cache
+    if cached_input is not agent_input:
+        prefix = json.dumps({
+            "incidentId": agent_input.incident_id,
+            "evidenceBundle": agent_input.evidence_bundle,
+            "timestamp": agent_input.timestamp,
+            "executionId": agent_input.execution_id,
+        })[:-1]
+        _input_text_prefix_cache = (agent_input, prefix)
     
-    if not agent_input.session_id:
-        raise ValueError("session_id is required")
+    return f'{prefix}, "budgetRemaining": {json.dumps(budget_remaining)}}}'
 
 
 def validate_agent_output(raw_output: Dict[str, JSONValue]) -> None:
@@ -355,6 +505,35 @@ def validate_agent_output(raw_output: Dict[str, JSONValue]) -> None:
         raise ValueError("findings cannot be empty")
 
 
+def create_trace_entry(
+    node_id: str,
+    duration_ms: int,
+    status: str,
+    metadata: Optional[Dict[str, JSONValue]] = None,
+    timestamp: Optional[str] = None
+) -> ExecutionTraceEntry:
+    """
+    Create execution trace entry.
+    
+    Args:
+        node_id: Node identifier
+        duration_ms: Execution duration
+        status: Execution status (STARTED, COMPLETED, FAILED, RETRYING)
+        metadata: Optional metadata
+        timestamp: ISO-8601 timestamp (default: now)
+    
+    Returns:
+        Frozen trace entry
+    """
+    return ExecutionTraceEntry(
+        node_id=node_id,
+        timestamp=timestamp or datetime.utcnow().isoformat(),
+        duration_ms=duration_ms,
+        status=status,
+        metadata=metadata,
+    )
+
+
 def add_execution_trace(
     state: GraphState,
     node_id: str,
@@ -377,19 +556,10 @@ def add_execution_trace(
     Returns:
         NEW state with trace entry (original state unchanged)
     """
-    trace_entry = ExecutionTraceEntry(
-        node_id=node_id,
-        timestamp=datetime.utcnow().isoformat(),
-        duration_ms=duration_ms,
-        status=status,
-        metadata=metadata,
-    )
-    
-    # Functional-style update
-    new_state = state.copy()
-    new_state["execution_trace"] = state["execution_trace"] + [trace_entry]
+    trace_entry = create_trace_entry(node_id, duration_ms, status, metadata)
     
-    return new_state
+    # Functional-style update (trace is an append-only tuple)
+    return {**state, "execution_trace": (*state["execution_trace"], trace_entry)}
 
 
 def increment_retry_count(state: GraphState, agent_id: str) -> GraphState:
@@ -422,7 +592,8 @@ def create_failure_hypothesis(
     message: str,
     retryable: bool,
     retry_attempt: int,
-    cost: Dict[str, JSONValue]
+    cost: Dict[str, JSONValue],
+    timestamp: Optional[str] = None
 ) -> AgentOutput:
     """
     Create failure hypothesis with confidence = 0.0.
@@ -436,6 +607,7 @@ def create_failure_hypothesis(
         retryable: Can this be retried?
         retry_attempt: Current retry attempt
         cost: Cost metadata
+        timestamp: ISO-8601 timestamp (default: now)
     
     Returns:
         AgentOutput with FAILURE status and confidence 0.0
@@ -444,7 +616,7 @@ def create_failure_hypothesis(
         agent_id=agent_id,
         agent_version=agent_version,
         execution_id=execution_id,
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=timestamp or datetime.utcnow().isoformat(),
         duration=0,
         status="FAILURE",
         confidence=0.0,
@@ -470,6 +642,26 @@ def create_failure_hypothesis(
 # AGENT NODE WRAPPER
 # ============================================================================
 
+# Resolved on first guardrail event, then reused for the process lifetime.
+# Lazy because the tracing module creates AWS clients at import time.
+_guardrail_violation_handler: Optional[Callable] = None
+
+
+def get_guardrail_violation_handler() -> Callable:
+    """
+    Return tracing.guardrail_handler.handle_guardrail_violation (cached).
+    
+    Raises:
+        ImportError: If the tracing package is unavailable (callers log
+            and continue - guardrail logging never fails the agent)
+    """
+    global _guardrail_violation_handler
+    if _guardrail_violation_handler is None:
+        from ..tracing.guardrail_handler import handle_guardrail_violation
+        _guardrail_violation_handler = handle_guardrail_violation
+    return _guardrail_violation_handler
+
+
 def create_agent_node(
     agent_id: str,
     agent_version: str,
@@ -477,7 +669,7 @@ def create_agent_node(
     bedrock_agent_alias_id: str,
     max_retries: int = MAX_RETRIES,
     timeout_seconds: int = 30
-) -> Callable[[GraphState], GraphState]:
+) -> RunnableCallable:
     """
     Create a LangGraph node that invokes a Bedrock Agent.
     
@@ -490,7 +682,8 @@ def create_agent_node(
         timeout_seconds: Timeout per invocation (default: 30)
     
     Returns:
-        LangGraph node function: GraphState -> GraphState
+        LangGraph node (GraphState -> GraphState) with sync and async paths;
+        graph.invoke() uses the sync path, graph.ainvoke() the async one
     
     GUARANTEES:
     - Exactly one Bedrock Agent invocation per success
@@ -499,6 +692,31 @@ def create_agent_node(
     - Never raises exceptions
     - Always returns valid GraphState
     """
+    # Configuration is invariant per node: decide fail-closed once, raise per call
+    misconfigured_error = None
+    if not bedrock_agent_id or not bedrock_agent_alias_id:
+        misconfigured_error = (
+            f"Agent {agent_id} misconfigured: missing Bedrock agent ID or alias. "
+            f"agent_id={bedrock_agent_id!r}, alias_id={bedrock_agent_alias_id!r}"
+        )
+    
+    # Invariant request fields, resolved once per node
+    request_template = {
+        "agentId": bedrock_agent_id,
+        "agentAliasId": bedrock_agent_alias_id,
+        # Enable trace to debug response issues
+        "enableTrace": True,
+    }
+    
+    # Attach guardrails if configured
+    if GUARDRAIL_ID:
+        request_template["guardrailIdentifier"] = GUARDRAIL_ID
+        request_template["guardrailVersion"] = GUARDRAIL_VERSION
+    
+    if BEDROCK_LATENCY_OPTIMIZED:
+        request_template["bedrockModelConfigurations"] = {
+            "performanceConfig": {"latency": "optimized"},
+        }
     
     def agent_node(state: GraphState) -> GraphState:
         """
@@ -510,16 +728,15 @@ def create_agent_node(
         Returns:
             Updated graph state (functional update)
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        # One trace ID per invocation, shared by LLM and guardrail events
+        trace_id = str(uuid.uuid4())
         agent_input = state["agent_input"]
         retry_attempt = state["retry_count"].get(agent_id, 0)
         
-        # Fail-closed: Validate agent configuration at runtime
-        if not bedrock_agent_id or not bedrock_agent_alias_id:
-            raise RuntimeError(
-                f"Agent {agent_id} misconfigured: missing Bedrock agent ID or alias. "
-                f"agent_id={bedrock_agent_id!r}, alias_id={bedrock_agent_alias_id!r}"
-            )
+        # Fail-closed: Refuse to run a misconfigured agent (checked at runtime)
+        if misconfigured_error is not None:
+            raise RuntimeError(misconfigured_error)
         
         # Emit STARTED trace
         state = add_execution_trace(
@@ -539,65 +756,49 @@ def create_agent_node(
             # ================================================================
             # STEP 2: BUILD BEDROCK REQUEST
             # ================================================================
-            bedrock_request = {
-                "agentId": bedrock_agent_id,
-                "agentAliasId": bedrock_agent_alias_id,
-                "sessionId": agent_input.session_id,
-                "inputText": json.dumps({
-                    "incidentId": agent_input.incident_id,
-                    "evidenceBundle": agent_input.evidence_bundle,
-                    "timestamp": agent_input.timestamp,
-                    "executionId": agent_input.execution_id,
-                    "budgetRemaining": state["budget_remaining"],
-                }),
-            }
+            bedrock_request = request_template.copy()
+            bedrock_request["sessionId"] = agent_input.session_id
+            bedrock_request["inputText"] = build_input_text(agent_input, state["budget_remaining"])
             
             # ================================================================
             # STEP 3: INVOKE BEDROCK AGENT (WITH GUARDRAILS)
             # ================================================================
             # Diagnostic log for verification
-            print(f"[INFO] Invoking Bedrock agent {agent_id} | agent_id={bedrock_agent_id} | alias_id={bedrock_agent_alias_id}")
-            
-            # Attach guardrails if configured
-            if GUARDRAIL_ID:
-                bedrock_request['guardrailIdentifier'] = GUARDRAIL_ID
-                bedrock_request['guardrailVersion'] = GUARDRAIL_VERSION
-            
-            # Enable trace to debug response issues
-            bedrock_request['enableTrace'] = True
+            logger.info("Invoking Bedrock agent %s | agent_id=%s | alias_id=%s", agent_id, bedrock_agent_id, bedrock_agent_alias_id)
             
             bedrock_response = bedrock_agent_runtime.invoke_agent(**bedrock_request)
             
             # CRITICAL: Log the FULL raw response to understand structure
-            print(f"[RAW BEDROCK RESPONSE] Agent: {agent_id}")
-            print(f"[RAW BEDROCK RESPONSE] Keys: {list(bedrock_response.keys())}")
-            print(f"[RAW BEDROCK RESPONSE] Full response: {json.dumps(bedrock_response, default=str, indent=2)[:2000]}")
+            logger.debug("[RAW BEDROCK RESPONSE] Agent: %s", agent_id)
+            logger.debug("[RAW BEDROCK RESPONSE] Keys: %s", _LazyKeys(bedrock_response))
+            logger.debug("[RAW BEDROCK RESPONSE] Full response: %s", _LazyJSON(bedrock_response, 2000))
             
             # Log response structure for debugging
-            print(f"[DEBUG] Bedrock response keys for {agent_id}: {list(bedrock_response.keys())}")
-            print(f"[DEBUG] Full response metadata: {bedrock_response.get('ResponseMetadata', {})}")
+            logger.debug("Bedrock response keys for %s: %s", agent_id, _LazyKeys(bedrock_response))
+            logger.debug("Full response metadata: %s", bedrock_response.get('ResponseMetadata', {}))
             
-            if "completion" in bedrock_response:
-                print(f"[DEBUG] Agent {agent_id} returned streaming response")
+            has_completion = "completion" in bedrock_response
+            if has_completion:
+                logger.debug("Agent %s returned streaming response", agent_id)
             elif "output" in bedrock_response:
-                print(f"[DEBUG] Agent {agent_id} returned non-streaming response")
+                logger.debug("Agent %s returned non-streaming response", agent_id)
             else:
-                print(f"[WARNING] Agent {agent_id} returned unexpected response structure")
-                print(f"[DEBUG] Full response (first 500 chars): {str(bedrock_response)[:500]}")
+                logger.warning("Agent %s returned unexpected response structure", agent_id)
+                logger.debug("Full response (first 500 chars): %.500s", bedrock_response)
             
             # ================================================================
             # STEP 3.5: CHECK FOR GUARDRAIL VIOLATIONS
             # ================================================================
             # Handle response-based guardrail blocks
-            if bedrock_response.get('guardrailAction') == 'BLOCKED':
+            guardrail_action = bedrock_response.get('guardrailAction')
+            if guardrail_action == 'BLOCKED':
                 # Log violation (async, non-blocking)
                 try:
-                    from ..tracing.guardrail_handler import handle_guardrail_violation
-                    handle_guardrail_violation(
+                    get_guardrail_violation_handler()(
                         agent_id=agent_id,
                         incident_id=agent_input.incident_id,
                         execution_id=agent_input.execution_id,
-                        trace_id=str(uuid.uuid4()),
+                        trace_id=trace_id,
                         violation={
                             'type': bedrock_response.get('violationType', 'UNKNOWN'),
                             'action': 'BLOCK',
@@ -609,21 +810,20 @@ def create_agent_node(
                         model=bedrock_response.get('modelId', 'unknown')
                     )
                 except Exception as guardrail_error:
-                    print(f"WARNING: Guardrail violation logging failed: {guardrail_error}")
+                    logger.warning("Guardrail violation logging failed: %s", guardrail_error)
                 
                 # Return failure hypothesis (graceful degradation)
                 raise ValueError("Request blocked by guardrails")
             
             # Check for non-blocking violations (WARN mode)
-            if 'guardrailAction' in bedrock_response and bedrock_response['guardrailAction'] != 'BLOCKED':
+            elif guardrail_action is not None:
                 # Log violation (async, non-blocking)
                 try:
-                    from ..tracing.guardrail_handler import handle_guardrail_violation
-                    handle_guardrail_violation(
+                    get_guardrail_violation_handler()(
                         agent_id=agent_id,
                         incident_id=agent_input.incident_id,
                         execution_id=agent_input.execution_id,
-                        trace_id=str(uuid.uuid4()),
+                        trace_id=trace_id,
                         violation={
                             'type': bedrock_response.get('violationType', 'UNKNOWN'),
                             'action': 'WARN',
@@ -635,52 +835,57 @@ def create_agent_node(
                         model=bedrock_response.get('modelId', 'unknown')
                     )
                 except Exception as guardrail_error:
-                    print(f"WARNING: Guardrail violation logging failed: {guardrail_error}")
+                    logger.warning("Guardrail violation logging failed: %s", guardrail_error)
                 # Continue with agent execution (WARN mode)
             
             # Parse response (streaming or non-streaming)
             raw_output = {}
-            completion_text = ""
             
-            if "completion" in bedrock_response:
-                # Streaming response - collect all chunks
+            if has_completion:
+                # Streaming response - collect all chunk bytes, decode once.
+                # Parsed in one orjson.loads after the stream ends: outputs are
+                # a few KB, so an incremental (pure-Python) parser would cost
+                # more CPU than it could hide behind the remaining network time.
+                completion_bytes = bytearray()
                 chunk_count = 0
                 for event in bedrock_response["completion"]:
-                    if "chunk" in event:
-                        chunk = event["chunk"]
-                        if "bytes" in chunk:
-                            chunk_text = chunk["bytes"].decode()
-                            completion_text += chunk_text
+                    chunk = event.get("chunk")
+                    if chunk is not None:
+                        chunk_bytes = chunk.get("bytes")
+                        if chunk_bytes is not None:
+                            completion_bytes += chunk_bytes
                             chunk_count += 1
                 
-                print(f"[DEBUG] Agent {agent_id} received {chunk_count} chunks, total length: {len(completion_text)}")
-                print(f"[DEBUG] Completion text (first 200 chars): {completion_text[:200]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Agent %s received %d chunks, total length: %d", agent_id, chunk_count, len(completion_bytes))
+                    logger.debug("Completion text (first 200 chars): %.200s", completion_bytes.decode(errors="replace"))
                 
-                # Parse accumulated text
-                if completion_text:
+                # Parse accumulated bytes (orjson validates UTF-8 itself)
+                if completion_bytes:
                     try:
-                        raw_output = json.loads(completion_text)
-                        print(f"[DEBUG] Successfully parsed JSON output for {agent_id}")
-                    except json.JSONDecodeError as e:
+                        raw_output = orjson.loads(completion_bytes)
+                        logger.debug("Successfully parsed JSON output for %s", agent_id)
+                    except orjson.JSONDecodeError as e:
                         # If not JSON, agent returned plain text - this means no final response
-                        print(f"[ERROR] Agent {agent_id} returned non-JSON response: {e}")
-                        print(f"[DEBUG] Full completion text: {completion_text}")
+                        completion_text = completion_bytes.decode(errors="replace")
+                        logger.error("Agent %s returned non-JSON response: %s", agent_id, e)
+                        logger.debug("Full completion text: %s", completion_text)
                         raise ValueError(
                             f"Agent {agent_id} returned non-JSON response. "
                             f"This usually means the agent has no action groups and is not configured "
                             f"to produce final output. Response: {completion_text[:200]}"
                         )
                 else:
-                    print(f"[ERROR] Agent {agent_id} returned empty completion")
+                    logger.error("Agent %s returned empty completion", agent_id)
                     raise ValueError(f"Agent {agent_id} returned empty response")
             else:
                 # Non-streaming response
                 if "output" in bedrock_response and "text" in bedrock_response["output"]:
-                    raw_output = json.loads(bedrock_response["output"]["text"])
-                    print(f"[DEBUG] Successfully parsed non-streaming output for {agent_id}")
+                    raw_output = orjson.loads(bedrock_response["output"]["text"])
+                    logger.debug("Successfully parsed non-streaming output for %s", agent_id)
                 else:
                     # Empty response - agent produced no output
-                    print(f"[ERROR] Agent {agent_id} returned no output field")
+                    logger.error("Agent %s returned no output field", agent_id)
                     raise ValueError(
                         f"Agent {agent_id} returned empty response. "
                         f"This usually means the agent has no action groups and is not configured "
@@ -702,28 +907,36 @@ def create_agent_node(
             # ================================================================
             # CRITICAL: Emit trace AFTER cost computation, BEFORE storage
             # Redaction happens in trace processor Lambda
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            # One completion timestamp for trace event, output and trace entry
+            now_iso = datetime.utcnow().isoformat()
             
             try:
+                # Split estimated cost by token share (zero tokens -> zero split)
+                input_tokens = cost["inputTokens"]
+                output_tokens = cost["outputTokens"]
+                total_cost = cost["estimatedCost"]
+                input_cost = total_cost * input_tokens / ((input_tokens + output_tokens) or 1)
+                
                 emit_trace_event_async(
-                    trace_id=str(uuid.uuid4()),
-                    timestamp=datetime.utcnow().isoformat(),
+                    trace_id=trace_id,
+                    timestamp=now_iso,
                     agent_id=agent_id,
                     incident_id=agent_input.incident_id,
                     execution_id=agent_input.execution_id,
-                    model=cost.get("model", "unknown"),
+                    model=cost["model"],
                     model_version=agent_version,
                     prompt_text=bedrock_request["inputText"],
-                    prompt_tokens=cost.get("inputTokens", 0),
+                    prompt_tokens=input_tokens,
                     prompt_template=agent_id,  # Use agent_id as template identifier
                     prompt_variables={},  # Variables already in inputText
-                    response_text=json.dumps(raw_output),
-                    response_tokens=cost.get("outputTokens", 0),
+                    response_text=orjson.dumps(raw_output).decode(),
+                    response_tokens=output_tokens,
                     finish_reason=raw_output.get("status", "stop"),
                     latency=duration_ms,
-                    input_cost=cost.get("estimatedCost", 0.0) * (cost.get("inputTokens", 0) / (cost.get("inputTokens", 0) + cost.get("outputTokens", 1))),
-                    output_cost=cost.get("estimatedCost", 0.0) * (cost.get("outputTokens", 0) / (cost.get("inputTokens", 1) + cost.get("outputTokens", 0))),
-                    total_cost=cost.get("estimatedCost", 0.0),
+                    input_cost=input_cost,
+                    output_cost=total_cost - input_cost,
+                    total_cost=total_cost,
                     retry_count=retry_attempt,
                     guardrails_applied=[],
                     validation_status="passed",
@@ -731,7 +944,7 @@ def create_agent_node(
                 )
             except Exception as trace_error:
                 # CRITICAL: Tracing failures are logged but NOT propagated
-                print(f"WARNING: Trace emission failed: {trace_error}")
+                logger.warning("Trace emission failed: %s", trace_error)
                 # Continue with agent execution
             
             # ================================================================
@@ -742,7 +955,7 @@ def create_agent_node(
                 agent_id=agent_id,
                 agent_version=agent_version,
                 execution_id=agent_input.execution_id,
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=now_iso,
                 duration=duration_ms,
                 status=raw_output["status"],
                 confidence=raw_output["confidence"],
@@ -765,14 +978,18 @@ def create_agent_node(
             # ================================================================
             # STEP 7: UPDATE STATE (FUNCTIONAL)
             # ================================================================
+            # Single state copy: hypothesis + COMPLETED trace together
             new_state = state.copy()
             new_state["hypotheses"] = {**state["hypotheses"], agent_id: agent_output}
-            new_state = add_execution_trace(
-                new_state,
-                agent_id,
-                duration_ms,
-                "COMPLETED",
-                {"confidence": agent_output.confidence, "status": agent_output.status}
+            new_state["execution_trace"] = (
+                *state["execution_trace"],
+                create_trace_entry(
+                    agent_id,
+                    duration_ms,
+                    "COMPLETED",
+                    {"confidence": agent_output.confidence, "status": agent_output.status},
+                    now_iso,
+                ),
             )
             
             return new_state
@@ -781,18 +998,17 @@ def create_agent_node(
             # ================================================================
             # FAILURE PATH
             # ================================================================
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             # Check for exception-based guardrail blocks
             if type(e).__name__ == 'GuardrailInterventionException':
                 # Log violation (async, non-blocking)
                 try:
-                    from ..tracing.guardrail_handler import handle_guardrail_violation
-                    handle_guardrail_violation(
+                    get_guardrail_violation_handler()(
                         agent_id=agent_id,
                         incident_id=agent_input.incident_id,
                         execution_id=agent_input.execution_id,
-                        trace_id=str(uuid.uuid4()),
+                        trace_id=trace_id,
                         violation={
                             'type': getattr(e, 'violationType', 'UNKNOWN'),
                             'action': 'BLOCK',
@@ -804,12 +1020,13 @@ def create_agent_node(
                         model='unknown'
                     )
                 except Exception as guardrail_error:
-                    print(f"WARNING: Guardrail violation logging failed: {guardrail_error}")
+                    logger.warning("Guardrail violation logging failed: %s", guardrail_error)
             
-            # Map exception to error code
-            error_code = map_exception_to_error_code(e)
+            # Map exception to error code (enum for classification, name for state)
+            error_enum = classify_exception(e)
+            error_code = error_enum.name
             message = str(e)
-            retryable = is_retryable_error(error_code)
+            retryable = is_retryable_error(error_enum)
             
             # Check if retry eligible
             if retryable and retry_attempt < max_retries:
@@ -836,6 +1053,9 @@ def create_agent_node(
             # NON-RETRYABLE OR MAX RETRIES EXCEEDED
             # ================================================================
             
+            # One failure timestamp for error, hypothesis and trace entry
+            now_iso = datetime.utcnow().isoformat()
+            
             # Extract cost (may be zero or partial)
             cost = extract_cost_metadata(
                 bedrock_response=None if "bedrock_response" not in locals() else bedrock_response,
@@ -848,7 +1068,7 @@ def create_agent_node(
                 error_code=error_code,
                 message=message,
                 retryable=retryable,
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=now_iso,
                 retry_attempt=retry_attempt,
                 details=None,
             )
@@ -863,20 +1083,160 @@ def create_agent_node(
                 retryable=retryable,
                 retry_attempt=retry_attempt,
                 cost=cost,
+                timestamp=now_iso,
             )
             
             # Update state (functional)
+            # Single state copy: hypothesis + error + FAILED trace together
             new_state = state.copy()
             new_state["hypotheses"] = {**state["hypotheses"], agent_id: failure_output}
-            new_state["errors"] = state["errors"] + [structured_error]
-            new_state = add_execution_trace(
-                new_state,
-                agent_id,
-                duration_ms,
-                "FAILED",
-                {"error_code": error_code, "retry_attempt": retry_attempt}
+            new_state["errors"] = (*state["errors"], structured_error)
+            new_state["execution_trace"] = (
+                *state["execution_trace"],
+                create_trace_entry(
+                    agent_id,
+                    duration_ms,
+                    "FAILED",
+                    {"error_code": error_code, "retry_attempt": retry_attempt},
+                    now_iso,
+                ),
             )
             
             return new_state
     
-    return agent_node
+    async def aagent_node(state: GraphState) -> GraphState:
+        """
+        Async variant of agent_node.
+        
+        invoke_agent and the completion stream are blocking botocore I/O,
+        so the whole invocation runs in the default executor and the event
+        loop stays free while Bedrock responds.
+        
+        Args:
+            state: Current graph state
+        
+        Returns:
+            Updated graph state (functional update)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, agent_node, state)
+    
+    return RunnableCallable(agent_node, aagent_node, name=agent_id, trace=False)
+
+
+# ============================================================================
+# BATCH INVOCATION
+# ============================================================================
+
+def merge_agent_states(state: GraphState, results: Sequence[GraphState]) -> GraphState:
+    """
+    Fold the states returned by independent agent nodes into one state.
+    
+    Each result was produced from the same input state, and agent nodes
+    only add to hypotheses, retry_count, execution_trace and errors. The
+    fold applies each result's additions in the order given, so the merged
+    state is deterministic regardless of completion order.
+    
+    Args:
+        state: Input state every agent node was invoked with
+        results: Agent node outputs, in canonical agent order
+    
+    Returns:
+        Merged graph state (functional update)
+    """
+    trace_base = len(state["execution_trace"])
+    errors_base = len(state["errors"])
+    
+    hypotheses = dict(state["hypotheses"])
+    retry_count = dict(state["retry_count"])
+    execution_trace: List[ExecutionTraceEntry] = list(state["execution_trace"])
+    errors: List[StructuredError] = list(state["errors"])
+    
+    for result in results:
+        hypotheses.update(result["hypotheses"])
+        retry_count.update(result["retry_count"])
+        execution_trace.extend(result["execution_trace"][trace_base:])
+        errors.extend(result["errors"][errors_base:])
+    
+    new_state = state.copy()
+    new_state["hypotheses"] = hypotheses
+    new_state["retry_count"] = retry_count
+    new_state["execution_trace"] = tuple(execution_trace)
+    new_state["errors"] = tuple(errors)
+    
+    return new_state
+
+
+async def run_agents_batch(
+    state: GraphState,
+    agent_nodes: Sequence[RunnableCallable],
+) -> GraphState:
+    """
+    Invoke several agent nodes concurrently and merge their results.
+    
+    All invocations share the module-level pooled Bedrock client, so
+    connections and TLS sessions are reused across agents.
+    
+    Args:
+        state: Current graph state
+        agent_nodes: Nodes from create_agent_node, in canonical agent order
+    
+    Returns:
+        Merged graph state (see merge_agent_states)
+    """
+    results = await asyncio.gather(*(node.ainvoke(state) for node in agent_nodes))
+    return merge_agent_states(state, results)
+
+
+def create_parallel_agents_node(
+    agent_nodes: Sequence[RunnableCallable],
+    name: str = "parallel-agents",
+) -> RunnableCallable:
+    """
+    Create a single graph node that runs all agent nodes concurrently.
+    
+    Agents read only agent_input and budget_remaining from the state and
+    never each other's hypotheses, so they are independent. Running them
+    inside one node lets consensus start as soon as the slowest agent
+    finishes. Results are merged in the given (canonical) order, so the
+    output state does not depend on completion order. Agents that already
+    have a hypothesis in the input state are not invoked again.
+    
+    graph.invoke runs the agents on worker threads, one per pending agent
+    in a pool owned by that invocation, so concurrent graph.invoke /
+    graph.batch calls never queue behind each other; graph.ainvoke gathers
+    them on the event loop (run_agents_batch).
+    
+    The fan-out is one graph node, hence one checkpoint: there is no
+    per-agent resume, and an interruption mid-fan-out re-runs all six
+    agents on resume, including any that had already finished.
+    
+    Args:
+        agent_nodes: Nodes from create_agent_node, in canonical agent order
+        name: Graph node name
+    
+    Returns:
+        RunnableCallable graph node
+    """
+    agent_nodes = tuple(agent_nodes)
+    
+    def pending_nodes(state: GraphState) -> List[RunnableCallable]:
+        hypotheses = state["hypotheses"]
+        return [node for node in agent_nodes if node.name not in hypotheses]
+    
+    def parallel_agents_node(state: GraphState) -> GraphState:
+        nodes = pending_nodes(state)
+        if not nodes:
+            return merge_agent_states(state, [])
+        # Each agent blocks on botocore I/O for the whole invocation
+        with ThreadPoolExecutor(
+            max_workers=len(nodes),
+            thread_name_prefix='agent-fanout',
+        ) as pool:
+            results = list(pool.map(lambda node: node.invoke(state), nodes))
+        return merge_agent_states(state, results)
+    
+    async def aparallel_agents_node(state: GraphState) -> GraphState:
+        return await run_agents_batch(state, pending_nodes(state))
+    
+    return RunnableCallable(parallel_agents_node, aparallel_agents_node, name=name, trace=False)
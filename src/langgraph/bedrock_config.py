@@ -7,7 +7,8 @@ These are wired into the LangGraph orchestration for agent invocation.
 CRITICAL: These IDs are stable and should not change unless agents are redeployed.
 """
 
-from typing import Dict, TypedDict
+from types import MappingProxyType
+from typing import Dict, Mapping, TypedDict
 
 
 class AgentConfig(TypedDict):
@@ -55,6 +56,17 @@ BEDROCK_AGENTS: Dict[str, AgentConfig] = {
 }
 
 
+# BEDROCK_AGENTS is static, so the derived lookups are built once
+_AGENT_IDS: Mapping[str, str] = MappingProxyType({
+    name: config["agent_id"]
+    for name, config in BEDROCK_AGENTS.items()
+})
+_ALIAS_IDS: Mapping[str, str] = MappingProxyType({
+    name: config["alias_id"]
+    for name, config in BEDROCK_AGENTS.items()
+})
+
+
 def get_agent_config(agent_name: str) -> AgentConfig:
     """
     Get configuration for a specific agent.
@@ -68,39 +80,33 @@ def get_agent_config(agent_name: str) -> AgentConfig:
     Raises:
         KeyError: If agent_name is not found
     """
-    if agent_name not in BEDROCK_AGENTS:
+    try:
+        return BEDROCK_AGENTS[agent_name]
+    except KeyError:
         raise KeyError(
             f"Agent '{agent_name}' not found. "
             f"Available agents: {list(BEDROCK_AGENTS.keys())}"
-        )
-    
-    return BEDROCK_AGENTS[agent_name]
+        ) from None
 
 
-def get_all_agent_ids() -> Dict[str, str]:
+def get_all_agent_ids() -> Mapping[str, str]:
     """
     Get all agent IDs mapped by agent name.
     
     Returns:
-        Dictionary mapping agent name to agent ID
+        Read-only mapping of agent name to agent ID (built once at import)
     """
-    return {
-        name: config["agent_id"]
-        for name, config in BEDROCK_AGENTS.items()
-    }
+    return _AGENT_IDS
 
 
-def get_all_alias_ids() -> Dict[str, str]:
+def get_all_alias_ids() -> Mapping[str, str]:
     """
     Get all alias IDs mapped by agent name.
     
     Returns:
-        Dictionary mapping agent name to alias ID
+        Read-only mapping of agent name to alias ID (built once at import)
     """
-    return {
-        name: config["alias_id"]
-        for name, config in BEDROCK_AGENTS.items()
-    }
+    return _ALIAS_IDS
 
 
 # ============================================================================
@@ -144,5 +150,6 @@ def validate_config() -> bool:
     return True
 
 
-# Validate configuration on import
-validate_config()
+# Validate configuration on import (debug builds only; stripped by python -O)
+if __debug__:
+    validate_config()
@@ -4,16 +4,94 @@ Phase 6 Week 2: DynamoDB Checkpointer
 Implements LangGraph checkpointing using DynamoDB for replay determinism.
 """
 
-import json
+import asyncio
 import os
-from typing import Optional, Dict, Any
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from datetime import datetime
 
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
 
 
+# Binary checkpoint format: 1 version byte + zlib-compressed orjson payload.
+# Items written before this format are plain JSON strings and still readable.
+CHECKPOINT_FORMAT_ZLIB_V1 = b'\x01'
+CHECKPOINT_COMPRESSION_LEVEL = 3
+
+
+def encode_checkpoint(checkpoint: Any) -> bytes:
+    """
+    Encode checkpoint as versioned, compressed bytes (DynamoDB Binary).
+    
+    Args:
+        checkpoint: Checkpoint to encode
+    
+    Returns:
+        Version byte followed by zlib-compressed JSON
+    """
+    payload = orjson.dumps(checkpoint, option=orjson.OPT_NON_STR_KEYS)
+    return CHECKPOINT_FORMAT_ZLIB_V1 + zlib.compress(payload, CHECKPOINT_COMPRESSION_LEVEL)
+
+
+def decode_checkpoint(data: Any) -> Any:
+    """
+    Decode a stored checkpoint (Binary or legacy JSON string).
+    
+    Args:
+        data: Attribute value from DynamoDB
+    
+    Returns:
+        Decoded checkpoint
+    """
+    if isinstance(data, str):
+        return orjson.loads(data)
+    
+    # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+    raw = bytes(getattr(data, 'value', data))
+    version, body = raw[:1], raw[1:]
+    if version == CHECKPOINT_FORMAT_ZLIB_V1:
+        return orjson.loads(zlib.decompress(body))
+    raise ValueError(f"Unknown checkpoint format version: {version!r}")
+
+
+# Shared pool for concurrent checkpoint writes (sync and executor-backed async)
+DYNAMODB_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=10,
+)
+
+
+# Stateless; shared so put/get skip the Resource layer's per-call setup
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+# Decodes list() pages in parallel. zlib.decompress releases the GIL, so the
+# decompression step overlaps; orjson parsing itself stays serialized.
+# Threads start lazily, on first use.
+DECODE_PARALLEL_THRESHOLD = 3
+_DECODE_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix='checkpoint-decode',
+)
+
+
+def _decode_item_checkpoint(attribute: Dict[str, Any]) -> Any:
+    return decode_checkpoint(_DESERIALIZER.deserialize(attribute))
+
+
+def _encode_json(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class DynamoDBCheckpointer(BaseCheckpointSaver):
     """
     DynamoDB-based checkpointer for LangGraph state persistence.
@@ -44,43 +122,114 @@ class DynamoDBCheckpointer(BaseCheckpointSaver):
         self.region_name = region_name
         
         # Initialize DynamoDB client
-        self.dynamodb = boto3.resource('dynamodb', region_name=region_name)
+        self.dynamodb = boto3.resource(
+            'dynamodb',
+            region_name=region_name,
+            config=DYNAMODB_CLIENT_CONFIG,
+        )
         self.table = self.dynamodb.Table(self.table_name)
+        # Low-level client on the same connection pool; put/get/list use it
+        # directly and serialize attributes themselves
+        self.client = self.dynamodb.meta.client
     
-    def put(
+    def _build_item(
         self,
         config: Dict[str, Any],
         checkpoint: Checkpoint,
         metadata: Dict[str, Any],
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
-        Save checkpoint to DynamoDB.
+        Build the DynamoDB item for a checkpoint.
         
         Args:
             config: Configuration dict with thread_id
             checkpoint: Checkpoint to save
             metadata: Checkpoint metadata
+            
+        Returns:
+            Item dict for put_item
         """
         thread_id = config.get('configurable', {}).get('thread_id')
         if not thread_id:
             raise ValueError("thread_id required in config.configurable")
         
-        checkpoint_id = checkpoint.get('id', datetime.utcnow().isoformat())
+        # One clock read serves both the id fallback and created_at
+        now_iso = datetime.utcnow().isoformat()
+        checkpoint_id = checkpoint.get('id', now_iso)
+        
+        return {
+            'thread_id': thread_id,
+            'checkpoint_id': checkpoint_id,
+            'checkpoint': encode_checkpoint(checkpoint),
+            'metadata': _encode_json(metadata),
+            'created_at': now_iso + 'Z',
+        }
+    
+    def put(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """
+        Save checkpoint to DynamoDB (overwrites an existing checkpoint_id).
+        
+        Args:
+            config: Configuration dict with thread_id
+            checkpoint: Checkpoint to save
+            metadata: Checkpoint metadata
+        """
+        item = self._build_item(config, checkpoint, metadata)
         
         try:
-            self.table.put_item(
-                Item={
-                    'thread_id': thread_id,
-                    'checkpoint_id': checkpoint_id,
-                    'checkpoint': json.dumps(checkpoint),
-                    'metadata': json.dumps(metadata),
-                    'created_at': datetime.utcnow().isoformat() + 'Z',
-                }
+            self.client.put_item(
+                TableName=self.table_name,
+                Item={k: _SERIALIZER.serialize(v) for k, v in item.items()},
             )
         except ClientError as e:
             print(f"[DynamoDBCheckpointer] Error saving checkpoint: {e}")
             raise
     
+    def put_many(
+        self,
+        entries: Iterable[Tuple[Dict[str, Any], Checkpoint, Dict[str, Any]]],
+    ) -> None:
+        """
+        Save several checkpoints with BatchWriteItem.
+        
+        batch_writer packs up to 25 items per request and resends any
+        UnprocessedItems. Items are capped at 400KB by DynamoDB, so a full
+        batch always stays under the 16MB request limit.
+        
+        Args:
+            entries: (config, checkpoint, metadata) tuples
+        """
+        # Build every item first so a bad config fails before any write
+        items = [self._build_item(cfg, ckpt, md) for cfg, ckpt, md in entries]
+        self._batch_write(items)
+    
+    def _batch_write(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Write built items with batch_writer.
+        
+        Args:
+            items: Items from _build_item, oldest first
+        """
+        if not items:
+            return
+        
+        try:
+            # overwrite_by_pkeys dedupes repeated keys within a batch
+            # (BatchWriteItem rejects duplicates); the last write wins.
+            with self.table.batch_writer(
+                overwrite_by_pkeys=['thread_id', 'checkpoint_id'],
+            ) as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+        except ClientError as e:
+            print(f"[DynamoDBCheckpointer] Error saving checkpoints: {e}")
+            raise
+    
     def get(
         self,
         config: Dict[str, Any],
@@ -99,12 +248,15 @@ class DynamoDBCheckpointer(BaseCheckpointSaver):
             return None
         
         try:
-            # Query for latest checkpoint
-            response = self.table.query(
+            response = self.client.query(
+                TableName=self.table_name,
                 KeyConditionExpression='thread_id = :tid',
-                ExpressionAttributeValues={':tid': thread_id},
+                ExpressionAttributeValues={':tid': {'S': thread_id}},
                 ScanIndexForward=False,  # Descending order
                 Limit=1,
+                # Only the checkpoint blob is read; skip metadata etc.
+                ProjectionExpression='#ck',
+                ExpressionAttributeNames={'#ck': 'checkpoint'},
             )
             
             items = response.get('Items', [])
@@ -115,7 +267,7 @@ class DynamoDBCheckpointer(BaseCheckpointSaver):
             if not checkpoint_data:
                 return None
             
-            return json.loads(checkpoint_data)
+            return decode_checkpoint(_DESERIALIZER.deserialize(checkpoint_data))
             
         except ClientError as e:
             print(f"[DynamoDBCheckpointer] Error getting checkpoint: {e}")
@@ -141,26 +293,68 @@ class DynamoDBCheckpointer(BaseCheckpointSaver):
             return []
         
         try:
-            response = self.table.query(
+            response = self.client.query(
+                TableName=self.table_name,
                 KeyConditionExpression='thread_id = :tid',
-                ExpressionAttributeValues={':tid': thread_id},
+                ExpressionAttributeValues={':tid': {'S': thread_id}},
                 ScanIndexForward=False,  # Descending order
                 Limit=limit,
+                ProjectionExpression='#ck',
+                ExpressionAttributeNames={'#ck': 'checkpoint'},
             )
             
-            items = response.get('Items', [])
-            checkpoints = []
-            
-            for item in items:
-                checkpoint_data = item.get('checkpoint')
-                if checkpoint_data:
-                    checkpoints.append(json.loads(checkpoint_data))
+            raw = [
+                item['checkpoint']
+                for item in response.get('Items', [])
+                if item.get('checkpoint')
+            ]
             
-            return checkpoints
+            if len(raw) < DECODE_PARALLEL_THRESHOLD:
+                return [_decode_item_checkpoint(attribute) for attribute in raw]
+            return list(_DECODE_POOL.map(_decode_item_checkpoint, raw))
             
         except ClientError as e:
             print(f"[DynamoDBCheckpointer] Error listing checkpoints: {e}")
             return []
+    
+    # Async variants run the sync call on the default executor so a
+    # DynamoDB round-trip never blocks the event loop; boto3 clients are
+    # thread-safe and share the pool configured above.
+    
+    async def aput(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Async version of put."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.put, config, checkpoint, metadata)
+    
+    async def aput_many(
+        self,
+        entries: Iterable[Tuple[Dict[str, Any], Checkpoint, Dict[str, Any]]],
+    ) -> None:
+        """Async version of put_many."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.put_many, list(entries))
+    
+    async def aget(
+        self,
+        config: Dict[str, Any],
+    ) -> Optional[Checkpoint]:
+        """Async version of get."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, config)
+    
+    async def alist(
+        self,
+        config: Dict[str, Any],
+        limit: int = 10,
+    ) -> list:
+        """Async version of list."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.list, config, limit)
 
 
 def create_dynamodb_checkpointer(
@@ -12,14 +12,22 @@ CRITICAL RULES:
 5. Structured outputs only (no free text reasoning)
 """
 
+import hashlib
+import heapq
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict, defaultdict
+from itertools import repeat
+from operator import itemgetter
+
+import orjson
 
 from .state import (
     GraphState,
     AgentOutput,
+    Recommendation,
     ConsensusResult,
     ExecutionTraceEntry,
     JSONValue,
@@ -40,14 +48,56 @@ AGENT_WEIGHTS = {
     "response-strategy": 0.6,        # Meta-analysis
 }
 
+# Weight for agents missing from AGENT_WEIGHTS
+DEFAULT_AGENT_WEIGHT = 0.5
+
 # Conflict detection threshold
 CONFIDENCE_DIVERGENCE_THRESHOLD = 0.3
 
+# Max std dev of confidences in [0.0, 1.0] for N >= 2 agents
+# (see compute_max_possible_std_dev)
+MAX_POSSIBLE_STD_DEV = 0.5
+
+# Replay re-evaluates identical hypotheses; results are reused by content
+# hash. Cached lists/dicts are never handed out: consensus_node copies them
+# into each ConsensusResult, so a downstream mutation cannot reach the cache.
+CONSENSUS_CACHE_SIZE = 256
+_consensus_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_consensus_cache_lock = threading.Lock()
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def extract_recommendations(
+    hypotheses: Dict[str, AgentOutput]
+) -> List[Tuple[str, float, Recommendation]]:
+    """
+    Collect typed recommendations from non-failed agents.
+    
+    Shared by detect_conflicts and synthesize_unified_recommendation so
+    consensus_node walks the findings once.
+    
+    Args:
+        hypotheses: All agent outputs
+    
+    Returns:
+        List of (agent_id, confidence, recommendation), in hypotheses order
+    """
+    recommendations = []
+    for agent_id, output in hypotheses.items():
+        if output.status == "FAILURE":
+            continue  # Skip failed agents
+        
+        confidence = output.confidence
+        for rec in output.recommendations:
+            if rec.type is not None:
+                recommendations.append((agent_id, confidence, rec))
+    
+    return recommendations
+
+
 def aggregate_confidence(
     hypotheses: Dict[str, AgentOutput],
     agent_weights: Dict[str, float]
@@ -73,11 +123,14 @@ def aggregate_confidence(
     if not hypotheses:
         return 0.0
     
+    # Explicit running totals, not sum(): since Python 3.12 sum() of floats
+    # uses compensated summation, which changes the last bits of published
+    # consensus values and breaks replay against existing checkpoints
+    weights = map(agent_weights.get, hypotheses, repeat(DEFAULT_AGENT_WEIGHT))
     total_weighted_confidence = 0.0
     total_weight = 0.0
     
-    for agent_id, output in hypotheses.items():
-        weight = agent_weights.get(agent_id, 0.5)  # Default weight 0.5
+    for output, weight in zip(hypotheses.values(), weights):
         total_weighted_confidence += output.confidence * weight
         total_weight += weight
     
@@ -112,10 +165,10 @@ def compute_max_possible_std_dev(n_agents: int) -> float:
         return 0.0  # Single agent, no variance
     
     # For binary extremes, max std dev is always 0.5
-    return 0.5
+    return MAX_POSSIBLE_STD_DEV
 
 
-def compute_agreement_level(hypotheses: Dict[str, AgentOutput]) -> float:
+def compute_agreement_level(confidences: Sequence[float]) -> float:
     """
     Measure consensus across agents using confidence variance.
     
@@ -128,7 +181,7 @@ def compute_agreement_level(hypotheses: Dict[str, AgentOutput]) -> float:
         0.0 = Maximum disagreement (confidences at extremes)
     
     Args:
-        hypotheses: All agent outputs with confidence scores
+        confidences: Agent confidence scores (in hypotheses order)
     
     Returns:
         Agreement level (0.0-1.0), clamped to valid range
@@ -138,26 +191,25 @@ def compute_agreement_level(hypotheses: Dict[str, AgentOutput]) -> float:
         - All agents same confidence: Return 1.0 (std_dev = 0)
         - All agents failed (confidence = 0.0): Return 1.0 (agreement on failure)
     """
-    confidences = [output.confidence for output in hypotheses.values()]
+    n = len(confidences)
     
     # Edge case: Single agent
-    if len(confidences) < 2:
+    if n < 2:
         return 1.0
     
-    # Calculate standard deviation
-    mean_confidence = sum(confidences) / len(confidences)
-    variance = sum((c - mean_confidence) ** 2 for c in confidences) / len(confidences)
+    # Calculate standard deviation. Kept as plain sums with ** rather than
+    # statistics.pstdev/math.sqrt: those round differently in the last bit
+    # and would change published agreement levels (pstdev is also far slower)
+    mean_confidence = sum(confidences) / n
+    variance = sum([(c - mean_confidence) ** 2 for c in confidences]) / n
     std_dev = variance ** 0.5
     
     # Edge case: All same confidence (std_dev = 0)
     if std_dev == 0.0:
         return 1.0
     
-    # Compute max possible std dev
-    max_std_dev = compute_max_possible_std_dev(len(confidences))
-    
-    # Compute agreement level
-    agreement_level = 1.0 - (std_dev / max_std_dev)
+    # Compute agreement level (n >= 2 here, so the max std dev is constant)
+    agreement_level = 1.0 - (std_dev / MAX_POSSIBLE_STD_DEV)
     
     # Clamp to valid range [0.0, 1.0]
     return max(0.0, min(1.0, agreement_level))
@@ -165,7 +217,8 @@ def compute_agreement_level(hypotheses: Dict[str, AgentOutput]) -> float:
 
 def detect_conflicts(
     hypotheses: Dict[str, AgentOutput],
-    confidence_threshold: float = CONFIDENCE_DIVERGENCE_THRESHOLD
+    confidence_threshold: float = CONFIDENCE_DIVERGENCE_THRESHOLD,
+    recommendations: Optional[List[Tuple[str, float, Recommendation]]] = None
 ) -> List[Dict[str, JSONValue]]:
     """
     Identify conflicting recommendations across agents.
@@ -177,6 +230,7 @@ def detect_conflicts(
     Args:
         hypotheses: All agent outputs
         confidence_threshold: Min confidence difference to flag conflict
+        recommendations: Precomputed extract_recommendations() result
     
     Returns:
         List of conflict dicts with agents, type, description, resolution
@@ -188,36 +242,29 @@ def detect_conflicts(
     """
     conflicts = []
     
+    if recommendations is None:
+        recommendations = extract_recommendations(hypotheses)
+    
     # Group recommendations by type
     recommendations_by_type = defaultdict(list)
-    for agent_id, output in hypotheses.items():
-        if output.status == "FAILURE":
-            continue  # Skip failed agents
-        
-        # Extract recommendation types from findings
-        findings = output.findings
-        if "recommendations" in findings and isinstance(findings["recommendations"], list):
-            for rec in findings["recommendations"]:
-                if isinstance(rec, dict) and "type" in rec:
-                    recommendations_by_type[rec["type"]].append((agent_id, output.confidence, rec))
+    for entry in recommendations:
+        recommendations_by_type[entry[2].type].append(entry)
+    
+    # Highest confidence entry per type, found once (max() keeps the first
+    # of equal confidences, i.e. the earliest agent)
+    by_confidence = itemgetter(1)
+    top_by_type = {
+        rec_type: max(agents, key=by_confidence)
+        for rec_type, agents in recommendations_by_type.items()
+    }
     
     # Detect conflicts: different types with high confidence difference
-    recommendation_types = list(recommendations_by_type.keys())
-    for i, type1 in enumerate(recommendation_types):
-        for type2 in recommendation_types[i+1:]:
-            agents1 = recommendations_by_type[type1]
-            agents2 = recommendations_by_type[type2]
-            
-            # Find highest confidence for each type
-            max_conf1 = max((conf for _, conf, _ in agents1), default=0.0)
-            max_conf2 = max((conf for _, conf, _ in agents2), default=0.0)
-            
+    top_entries = list(top_by_type.items())
+    for i, (type1, (agent_id1, max_conf1, _)) in enumerate(top_entries):
+        for type2, (agent_id2, max_conf2, _) in top_entries[i+1:]:
             confidence_diff = abs(max_conf1 - max_conf2)
             
             if confidence_diff > confidence_threshold:
-                agent_id1 = next((aid for aid, conf, _ in agents1 if conf == max_conf1), "unknown")
-                agent_id2 = next((aid for aid, conf, _ in agents2 if conf == max_conf2), "unknown")
-                
                 conflicts.append({
                     "agents": [agent_id1, agent_id2],
                     "conflict_type": "ACTION_TYPE_DIVERGENCE",
@@ -230,14 +277,10 @@ def detect_conflicts(
         if len(agents) < 2:
             continue
         
-        confidences = [conf for _, conf, _ in agents]
-        max_conf = max(confidences)
-        min_conf = min(confidences)
+        max_agent, max_conf, _ = top_by_type[rec_type]
+        min_agent, min_conf, _ = min(agents, key=by_confidence)
         
         if max_conf - min_conf > confidence_threshold:
-            max_agent = next((aid for aid, conf, _ in agents if conf == max_conf), "unknown")
-            min_agent = next((aid for aid, conf, _ in agents if conf == min_conf), "unknown")
-            
             conflicts.append({
                 "agents": [max_agent, min_agent],
                 "conflict_type": "CONFIDENCE_DIVERGENCE",
@@ -250,7 +293,8 @@ def detect_conflicts(
 
 def synthesize_unified_recommendation(
     hypotheses: Dict[str, AgentOutput],
-    conflicts: List[Dict[str, JSONValue]]
+    conflicts: List[Dict[str, JSONValue]],
+    recommendations: Optional[List[Tuple[str, float, Recommendation]]] = None
 ) -> str:
     """
     Create unified recommendation from all agent outputs.
@@ -264,6 +308,7 @@ def synthesize_unified_recommendation(
     Args:
         hypotheses: All agent outputs
         conflicts: Detected conflicts
+        recommendations: Precomputed extract_recommendations() result
     
     Returns:
         Unified recommendation string (max 500 chars)
@@ -274,25 +319,21 @@ def synthesize_unified_recommendation(
         - Single recommendation type: "Unanimous: <recommendation>"
     """
     # Check if all agents failed
-    all_failed = all(output.status == "FAILURE" for output in hypotheses.values())
-    if all_failed:
+    n_total = sum(1 for output in hypotheses.values() if output.status != "FAILURE")
+    if n_total == 0:
         return "Insufficient data for recommendation. All agents failed."
     
     # Extract recommendations
+    if recommendations is None:
+        recommendations = extract_recommendations(hypotheses)
     recommendations_by_type = defaultdict(list)
-    for agent_id, output in hypotheses.items():
-        if output.status == "FAILURE":
-            continue
-        
-        findings = output.findings
-        if "recommendations" in findings and isinstance(findings["recommendations"], list):
-            for rec in findings["recommendations"]:
-                if isinstance(rec, dict) and "type" in rec and "description" in rec:
-                    recommendations_by_type[rec["type"]].append((
-                        agent_id,
-                        output.confidence,
-                        rec["description"]
-                    ))
+    for agent_id, confidence, rec in recommendations:
+        if rec.description is not None:
+            recommendations_by_type[rec.type].append((
+                agent_id,
+                confidence,
+                rec.description
+            ))
     
     if not recommendations_by_type:
         return "No actionable recommendations."
@@ -300,22 +341,18 @@ def synthesize_unified_recommendation(
     # Build unified recommendation
     parts = []
     
-    # Sort types by highest confidence
-    sorted_types = sorted(
-        recommendations_by_type.items(),
-        key=lambda x: max(conf for _, conf, _ in x[1]),
-        reverse=True
-    )
+    # Highest confidence recommendation per type; max() keeps the first of
+    # equal confidences, same as taking [0] of a stable descending sort
+    by_confidence = itemgetter(1)
+    top_by_type = [
+        (max(recs, key=by_confidence), len(recs))
+        for recs in recommendations_by_type.values()
+    ]
     
-    for i, (rec_type, recs) in enumerate(sorted_types[:2]):  # Top 2 types
-        # Get highest confidence recommendation
-        recs_sorted = sorted(recs, key=lambda x: x[1], reverse=True)
-        agent_id, confidence, description = recs_sorted[0]
-        
-        # Count agreeing agents
-        n_agree = len(recs)
-        n_total = len([o for o in hypotheses.values() if o.status != "FAILURE"])
-        
+    # Top 2 types by highest confidence (nlargest == sorted(reverse)[:2])
+    top_types = heapq.nlargest(2, top_by_type, key=lambda x: x[0][1])
+    
+    for i, ((agent_id, confidence, description), n_agree) in enumerate(top_types):
         label = "PRIMARY" if i == 0 else "ALTERNATIVE"
         parts.append(f"{label}: {description[:100]} (confidence: {confidence:.2f}, agents: {n_agree}/{n_total} agree)")
     
@@ -364,22 +401,24 @@ def extract_minority_opinions(
         if output.status == "FAILURE" or output.confidence <= 0.5:
             continue
         
-        findings = output.findings
-        if "recommendations" in findings and isinstance(findings["recommendations"], list):
-            for rec in findings["recommendations"]:
-                if isinstance(rec, dict) and "description" in rec:
-                    description = rec["description"]
-                    
-                    # Check if this recommendation is in unified
-                    if description[:50] not in unified_recommendation:
-                        minority_opinions.append(
-                            f"{agent_id} suggests {description[:100]} (confidence: {output.confidence:.2f})"
-                        )
+        for rec in output.recommendations:
+            description = rec.description
+            if description is None:
+                continue
+            
+            # Check if this recommendation is in unified
+            if description[:50] not in unified_recommendation:
+                minority_opinions.append(
+                    f"{agent_id} suggests {description[:100]} (confidence: {output.confidence:.2f})"
+                )
     
     return minority_opinions
 
 
-def compute_quality_metrics(hypotheses: Dict[str, AgentOutput]) -> Dict[str, float]:
+def compute_quality_metrics(
+    hypotheses: Dict[str, AgentOutput],
+    agreement_level: Optional[float] = None
+) -> Dict[str, float]:
     """
     Assess overall quality of agent outputs.
     
@@ -390,6 +429,7 @@ def compute_quality_metrics(hypotheses: Dict[str, AgentOutput]) -> Dict[str, flo
     
     Args:
         hypotheses: All agent outputs
+        agreement_level: Precomputed compute_agreement_level() result
     
     Returns:
         Quality metrics dict (all values 0.0-1.0)
@@ -408,19 +448,23 @@ def compute_quality_metrics(hypotheses: Dict[str, AgentOutput]) -> Dict[str, flo
     
     total_agents = len(hypotheses)
     
-    # Data completeness
-    success_count = sum(1 for output in hypotheses.values() if output.status == "SUCCESS")
+    # Data completeness and citation quality in one pass
+    success_count = 0
+    citation_count = 0
+    for output in hypotheses.values():
+        if output.status == "SUCCESS":
+            success_count += 1
+        if output.citations:
+            citation_count += 1
     data_completeness = success_count / total_agents if total_agents > 0 else 0.0
-    
-    # Citation quality
-    citation_count = sum(
-        1 for output in hypotheses.values()
-        if output.citations and len(output.citations) > 0
-    )
     citation_quality = citation_count / total_agents if total_agents > 0 else 0.0
     
     # Reasoning coherence (use agreement level)
-    reasoning_coherence = compute_agreement_level(hypotheses)
+    if agreement_level is None:
+        agreement_level = compute_agreement_level(
+            [output.confidence for output in hypotheses.values()]
+        )
+    reasoning_coherence = agreement_level
     
     return {
         "data_completeness": data_completeness,
@@ -434,7 +478,8 @@ def add_execution_trace(
     node_id: str,
     duration_ms: int,
     status: str,
-    metadata: Dict[str, JSONValue] = None
+    metadata: Dict[str, JSONValue] = None,
+    timestamp: Optional[str] = None
 ) -> GraphState:
     """
     Add execution trace entry.
@@ -447,51 +492,40 @@ def add_execution_trace(
         duration_ms: Execution duration
         status: Execution status
         metadata: Optional metadata
+        timestamp: ISO-8601 timestamp (default: now)
     
     Returns:
         NEW state with trace entry (original state unchanged)
     """
     trace_entry = ExecutionTraceEntry(
         node_id=node_id,
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=timestamp or datetime.utcnow().isoformat(),
         duration_ms=duration_ms,
         status=status,
         metadata=metadata or {},
     )
     
-    # Functional-style update
-    new_state = state.copy()
-    new_state["execution_trace"] = state["execution_trace"] + [trace_entry]
-    
-    return new_state
+    # Functional-style update (trace is an append-only tuple)
+    return {**state, "execution_trace": (*state["execution_trace"], trace_entry)}
 
 
 # ============================================================================
-# CONSENSUS NODE
+# CONSENSUS COMPUTATION
 # ============================================================================
 
-def consensus_node(state: GraphState) -> GraphState:
+def compute_consensus(hypotheses: Dict[str, AgentOutput]) -> tuple:
     """
-    LangGraph node for consensus and confidence aggregation.
-    
-    Pure deterministic computation (no LLM, no Bedrock).
+    Run the consensus pipeline over agent outputs.
     
     Args:
-        state: Current graph state with agent hypotheses
+        hypotheses: All agent outputs
     
     Returns:
-        Updated graph state with consensus result (functional update)
-    
-    GUARANTEES:
-    - Deterministic (same inputs → same outputs)
-    - No LLM calls
-    - No mutations
-    - Single execution (no retries)
+        (aggregated_confidence, agreement_level, conflicts,
+         unified_recommendation, minority_opinions, quality_metrics)
     """
-    start_time = time.time()
-    
-    hypotheses = state["hypotheses"]
     agent_weights = AGENT_WEIGHTS
+    confidences = [output.confidence for output in hypotheses.values()]
     
     # ========================================================================
     # STEP 1: AGGREGATE CONFIDENCE
@@ -501,17 +535,20 @@ def consensus_node(state: GraphState) -> GraphState:
     # ========================================================================
     # STEP 2: COMPUTE AGREEMENT LEVEL
     # ========================================================================
-    agreement_level = compute_agreement_level(hypotheses)
+    agreement_level = compute_agreement_level(confidences)
     
     # ========================================================================
     # STEP 3: DETECT CONFLICTS
     # ========================================================================
-    conflicts = detect_conflicts(hypotheses)
+    recommendations = extract_recommendations(hypotheses)
+    conflicts = detect_conflicts(hypotheses, recommendations=recommendations)
     
     # ========================================================================
     # STEP 4: SYNTHESIZE UNIFIED RECOMMENDATION
     # ========================================================================
-    unified_recommendation = synthesize_unified_recommendation(hypotheses, conflicts)
+    unified_recommendation = synthesize_unified_recommendation(
+        hypotheses, conflicts, recommendations
+    )
     
     # ========================================================================
     # STEP 5: EXTRACT MINORITY OPINIONS
@@ -521,30 +558,119 @@ def consensus_node(state: GraphState) -> GraphState:
     # ========================================================================
     # STEP 6: COMPUTE QUALITY METRICS
     # ========================================================================
-    quality_metrics = compute_quality_metrics(hypotheses)
+    quality_metrics = compute_quality_metrics(hypotheses, agreement_level)
+    
+    return (
+        aggregated_confidence,
+        agreement_level,
+        conflicts,
+        unified_recommendation,
+        minority_opinions,
+        quality_metrics,
+    )
+
+
+def consensus_cache_key(hypotheses: Dict[str, AgentOutput]) -> Optional[bytes]:
+    """
+    Content hash of everything compute_consensus reads.
+    
+    Order is kept (not sorted): ties are broken by hypotheses order.
+    
+    Args:
+        hypotheses: All agent outputs
+    
+    Returns:
+        16-byte digest, or None if findings are not JSON-serializable
+    """
+    try:
+        payload = orjson.dumps([
+            (agent_id, output.confidence, output.status, bool(output.citations), output.findings)
+            for agent_id, output in hypotheses.items()
+        ])
+    except TypeError:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+# ============================================================================
+# CONSENSUS NODE
+# ============================================================================
+
+def consensus_node(state: GraphState) -> GraphState:
+    """
+    LangGraph node for consensus and confidence aggregation.
+    
+    Pure deterministic computation (no LLM, no Bedrock).
+    
+    Args:
+        state: Current graph state with agent hypotheses
+    
+    Returns:
+        Updated graph state with consensus result (functional update)
+    
+    GUARANTEES:
+    - Deterministic (same inputs → same outputs)
+    - No LLM calls
+    - No mutations
+    - Single execution (no retries)
+    """
+    start_time = time.time()
+    
+    hypotheses = state["hypotheses"]
+    
+    # ========================================================================
+    # STEPS 1-6: COMPUTE (OR REUSE) CONSENSUS
+    # ========================================================================
+    cache_key = consensus_cache_key(hypotheses)
+    with _consensus_cache_lock:
+        cached = _consensus_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            _consensus_cache.move_to_end(cache_key)
+    
+    if cached is None:
+        cached = compute_consensus(hypotheses)
+        if cache_key is not None:
+            with _consensus_cache_lock:
+                _consensus_cache[cache_key] = cached
+                if len(_consensus_cache) > CONSENSUS_CACHE_SIZE:
+                    _consensus_cache.popitem(last=False)
+    
+    (
+        aggregated_confidence,
+        agreement_level,
+        conflicts,
+        unified_recommendation,
+        minority_opinions,
+        quality_metrics,
+    ) = cached
     
     # ========================================================================
     # STEP 7: CREATE CONSENSUS RESULT
     # ========================================================================
     duration_ms = int((time.time() - start_time) * 1000)
+    now_iso = datetime.utcnow().isoformat()
     
+    # Fresh containers per run (conflict dicts hold only str values and
+    # the agents list)
     consensus_result = ConsensusResult(
         aggregated_confidence=aggregated_confidence,
         agreement_level=agreement_level,
-        conflicts_detected=conflicts,
+        conflicts_detected=[
+            {**conflict, "agents": list(conflict["agents"])}
+            for conflict in conflicts
+        ],
         unified_recommendation=unified_recommendation,
-        minority_opinions=minority_opinions,
-        quality_metrics=quality_metrics,
-        timestamp=datetime.utcnow().isoformat(),
+        minority_opinions=list(minority_opinions),
+        quality_metrics=dict(quality_metrics),
+        timestamp=now_iso,
     )
     
     # ========================================================================
     # STEP 8: UPDATE STATE (FUNCTIONAL)
     # ========================================================================
-    new_state = state.copy()
-    new_state["consensus"] = consensus_result
+    # add_execution_trace already returns a fresh dict; fill it in place
     new_state = add_execution_trace(
-        new_state,
+        state,
         "consensus",
         duration_ms,
         "COMPLETED",
@@ -552,7 +678,9 @@ def consensus_node(state: GraphState) -> GraphState:
             "aggregated_confidence": aggregated_confidence,
             "agreement_level": agreement_level,
             "conflicts_count": len(conflicts),
-        }
+        },
+        timestamp=now_iso,
     )
+    new_state["consensus"] = consensus_result
     
     return new_state
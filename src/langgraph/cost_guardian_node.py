@@ -14,7 +14,7 @@ CRITICAL RULES:
 
 import time
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from .state import (
     GraphState,
@@ -222,7 +222,8 @@ def add_execution_trace(
     node_id: str,
     duration_ms: int,
     status: str,
-    metadata: Dict[str, JSONValue] = None
+    metadata: Dict[str, JSONValue] = None,
+    timestamp: Optional[str] = None
 ) -> GraphState:
     """
     Add execution trace entry.
@@ -235,23 +236,21 @@ def add_execution_trace(
         duration_ms: Execution duration
         status: Execution status
         metadata: Optional metadata
+        timestamp: ISO-8601 timestamp (default: now)
     
     Returns:
         NEW state with trace entry (original state unchanged)
     """
     trace_entry = ExecutionTraceEntry(
         node_id=node_id,
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=timestamp or datetime.utcnow().isoformat(),
         duration_ms=duration_ms,
         status=status,
         metadata=metadata or {},
     )
     
-    # Functional-style update
-    new_state = state.copy()
-    new_state["execution_trace"] = state["execution_trace"] + [trace_entry]
-    
-    return new_state
+    # Functional-style update (trace is an append-only tuple)
+    return {**state, "execution_trace": (*state["execution_trace"], trace_entry)}
 
 
 # ============================================================================
@@ -324,6 +323,7 @@ def cost_guardian_node(state: GraphState) -> GraphState:
     # STEP 7: CREATE COST GUARDIAN RESULT
     # ========================================================================
     duration_ms = int((time.time() - start_time) * 1000)
+    now_iso = datetime.utcnow().isoformat()
     
     cost_guardian_result = CostGuardianResult(
         total_cost=total_cost,
@@ -334,17 +334,15 @@ def cost_guardian_node(state: GraphState) -> GraphState:
             "monthlyBurn": monthly_burn,
             "incidentsRemaining": incidents_remaining,
         },
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
     )
     
     # ========================================================================
     # STEP 8: UPDATE STATE (FUNCTIONAL)
     # ========================================================================
-    new_state = state.copy()
-    new_state["cost_guardian"] = cost_guardian_result
-    new_state["budget_remaining"] = budget_remaining_after  # Update budget
+    # add_execution_trace already returns a fresh dict; fill it in place
     new_state = add_execution_trace(
-        new_state,
+        state,
         "cost-guardian",
         duration_ms,
         "COMPLETED",
@@ -352,7 +350,10 @@ def cost_guardian_node(state: GraphState) -> GraphState:
             "total_cost": total_cost,
             "budget_remaining": budget_remaining_after,
             "budget_exceeded": budget_exceeded,
-        }
+        },
+        timestamp=now_iso,
     )
+    new_state["cost_guardian"] = cost_guardian_result
+    new_state["budget_remaining"] = budget_remaining_after  # Update budget
     
     return new_state
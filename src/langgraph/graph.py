@@ -6,9 +6,12 @@ entry/terminal nodes, and deterministic execution order.
 
 CRITICAL RULES:
 1. Linear topology only (no branching, no conditional edges)
-2. Fixed execution order (same input → same path)
+2. Fixed execution order (same input → same path; the six agents run
+   concurrently inside one node and are merged in canonical order)
 3. Functional state updates (no mutation)
-4. Checkpointing after each node
+4. Checkpointing after each node; the agent fan-out is a single node,
+   so there is no per-agent resume (an interrupted fan-out re-runs all
+   six agents)
 5. Replay-safe (deterministic execution)
 """
 
@@ -26,7 +29,7 @@ from .state import (
     JSONValue,
     create_initial_state,
 )
-from .agent_node import create_agent_node
+from .agent_node import create_agent_node, create_parallel_agents_node
 from .consensus_node import consensus_node
 from .cost_guardian_node import cost_guardian_node
 from .checkpointing import create_dynamodb_checkpointer
@@ -140,8 +143,8 @@ def entry_node(external_input: Dict[str, JSONValue]) -> GraphState:
             - cost_guardian: None
             - budget_remaining: float
             - retry_count: {}
-            - execution_trace: [ENTRY trace]
-            - errors: []
+            - execution_trace: (ENTRY trace,)
+            - errors: ()
             - session_id: str
             - start_timestamp: str
     
@@ -197,7 +200,7 @@ def entry_node(external_input: Dict[str, JSONValue]) -> GraphState:
     
     # Functional update
     new_state = initial_state.copy()
-    new_state["execution_trace"] = [entry_trace]
+    new_state["execution_trace"] = (entry_trace,)
     
     return new_state
 
@@ -334,21 +337,37 @@ def terminal_node(state: GraphState) -> Dict[str, JSONValue]:
 # GRAPH CONSTRUCTION
 # ============================================================================
 
+# Bedrock agents in canonical order (agent ID, env var prefix). Agent
+# results are merged in this order, keeping hypotheses, execution trace
+# and errors deterministic.
+AGENT_NODE_SPECS = (
+    ("signal-intelligence", "SIGNAL_INTELLIGENCE"),
+    ("historical-pattern", "HISTORICAL_PATTERN"),
+    ("change-intelligence", "CHANGE_INTELLIGENCE"),
+    ("risk-blast-radius", "RISK_BLAST_RADIUS"),
+    ("knowledge-rag", "KNOWLEDGE_RAG"),
+    ("response-strategy", "RESPONSE_STRATEGY"),
+)
+
 def create_graph() -> StateGraph:
     """
     Create and wire LangGraph DAG.
     
     Topology (LINEAR):
-        signal-intelligence → historical-pattern → 
-        change-intelligence → risk-blast-radius → knowledge-rag → 
-        response-strategy → consensus-node → cost-guardian-node → TERMINAL → END
+        parallel-agents → consensus-node → cost-guardian-node → TERMINAL → END
+    
+    parallel-agents runs the 6 Bedrock agents (AGENT_NODE_SPECS)
+    concurrently and merges their results in canonical order.
     
     Features:
-        - Linear execution (no branching, no conditional edges)
-        - Checkpointing after each node (MemorySaver)
-        - Deterministic execution order
+        - Linear node sequence (no branching, no conditional edges);
+          agents run concurrently inside parallel-agents
+        - Checkpointing after each node (MemorySaver): one checkpoint for
+          the whole agent fan-out, so a crash mid-fan-out re-runs every
+          agent on resume (no per-agent resume granularity)
+        - Deterministic execution order and merged state
         - Entry and terminal validation
-        - 9 edges total (one between each consecutive node)
+        - 4 edges total (one between each consecutive node)
     
     Returns:
         Compiled StateGraph with checkpointing
@@ -374,66 +393,17 @@ def create_graph() -> StateGraph:
     # ADD NODES
     # ========================================================================
     
-    # Bedrock Agent nodes (6)
-    graph.add_node(
-        "signal-intelligence",
-        create_agent_node(
-            agent_id="signal-intelligence",
-            agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("SIGNAL_INTELLIGENCE_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("SIGNAL_INTELLIGENCE_ALIAS_ID", ""),
-        )
-    )
-    
-    graph.add_node(
-        "historical-pattern",
-        create_agent_node(
-            agent_id="historical-pattern",
-            agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("HISTORICAL_PATTERN_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("HISTORICAL_PATTERN_ALIAS_ID", ""),
-        )
-    )
-    
-    graph.add_node(
-        "change-intelligence",
-        create_agent_node(
-            agent_id="change-intelligence",
-            agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("CHANGE_INTELLIGENCE_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("CHANGE_INTELLIGENCE_ALIAS_ID", ""),
-        )
-    )
-    
-    graph.add_node(
-        "risk-blast-radius",
-        create_agent_node(
-            agent_id="risk-blast-radius",
-            agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("RISK_BLAST_RADIUS_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("RISK_BLAST_RADIUS_ALIAS_ID", ""),
-        )
-    )
-    
-    graph.add_node(
-        "knowledge-rag",
+    # Bedrock Agent nodes (6), run concurrently inside one fan-out node
+    agent_nodes = [
         create_agent_node(
-            agent_id="knowledge-rag",
+            agent_id=agent_id,
             agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("KNOWLEDGE_RAG_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("KNOWLEDGE_RAG_ALIAS_ID", ""),
+            bedrock_agent_id=os.environ.get(f"{env_prefix}_AGENT_ID", ""),
+            bedrock_agent_alias_id=os.environ.get(f"{env_prefix}_ALIAS_ID", ""),
         )
-    )
-    
-    graph.add_node(
-        "response-strategy",
-        create_agent_node(
-            agent_id="response-strategy",
-            agent_version="1.0.0",
-            bedrock_agent_id=os.environ.get("RESPONSE_STRATEGY_AGENT_ID", ""),
-            bedrock_agent_alias_id=os.environ.get("RESPONSE_STRATEGY_ALIAS_ID", ""),
-        )
-    )
+        for agent_id, env_prefix in AGENT_NODE_SPECS
+    ]
+    graph.add_node("parallel-agents", create_parallel_agents_node(agent_nodes))
     
     # Deterministic nodes (2)
     # Note: Cannot use "consensus" or "cost_guardian" as node names (state key conflict)
@@ -444,19 +414,14 @@ def create_graph() -> StateGraph:
     graph.add_node("TERMINAL", terminal_node)
     
     # ========================================================================
-    # ADD EDGES (LINEAR - 8 EDGES TOTAL)
+    # ADD EDGES (LINEAR - 3 EDGES TOTAL)
     # ========================================================================
     
-    # Set entry point (first agent node)
-    graph.set_entry_point("signal-intelligence")
+    # Set entry point (agent fan-out node)
+    graph.set_entry_point("parallel-agents")
     
     # Linear edges (no branching, no conditional edges)
-    graph.add_edge("signal-intelligence", "historical-pattern")
-    graph.add_edge("historical-pattern", "change-intelligence")
-    graph.add_edge("change-intelligence", "risk-blast-radius")
-    graph.add_edge("risk-blast-radius", "knowledge-rag")
-    graph.add_edge("knowledge-rag", "response-strategy")
-    graph.add_edge("response-strategy", "consensus-node")
+    graph.add_edge("parallel-agents", "consensus-node")
     graph.add_edge("consensus-node", "cost-guardian-node")
     graph.add_edge("cost-guardian-node", "TERMINAL")
     
@@ -7,13 +7,61 @@ Handles BOTH exception-based and response-based guardrail blocks.
 
 import os
 import boto3
+from botocore.config import Config
 from typing import Dict, Any
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# src/ must be on the import path (deployment PYTHONPATH / pytest rootdir)
 from tracing.guardrail_handler import handle_guardrail_violation_sync
 
 # AWS clients
-bedrock_agent_runtime = boto3.client('bedrock-agent-runtime')
+# Keep-alive + pooled connections survive across warm invocations; this path
+# has no node-level retry, so the SDK absorbs throttling (adaptive mode)
+BEDROCK_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=60,
+)
+bedrock_agent_runtime = boto3.client('bedrock-agent-runtime', config=BEDROCK_CLIENT_CONFIG)
+
+
+class _NoGuardrailInterventionException(Exception):
+    """Placeholder for SDK models that don't define the exception (never raised)."""
+
+
+# Client exception classes are generated lazily from the service model; resolve
+# once here so the model scan lands in cold start, not the first failed call
+_GuardrailInterventionException = getattr(
+    bedrock_agent_runtime.exceptions,
+    'GuardrailInterventionException',
+    _NoGuardrailInterventionException,
+)
+
+# Lambda configuration is fixed for the life of the container; read once
+GUARDRAIL_ID = os.environ.get('GUARDRAIL_ID')
+GUARDRAIL_VERSION = os.environ.get('GUARDRAIL_VERSION', '1')
+AGENT_ALIAS_ID = os.environ.get('AGENT_ALIAS_ID', 'TSTALIASID')
+
+# Latency-optimized inference (opt-in; only some models/regions support it)
+BEDROCK_LATENCY_OPTIMIZED = os.environ.get('BEDROCK_LATENCY_OPTIMIZED', 'false').lower() == 'true'
+_MODEL_CONFIG_KWARGS = (
+    {'bedrockModelConfigurations': {'performanceConfig': {'latency': 'optimized'}}}
+    if BEDROCK_LATENCY_OPTIMIZED else {}
+)
+
+# Non-blocking guardrail actions that always indicate a violation
+WARN_GUARDRAIL_ACTIONS = ('INTERVENED', 'WARN')
+
+
+def _violation_from_response(response: Dict[str, Any], action: str) -> Dict[str, Any]:
+    """Build the violation record from a guardrail response (or exception attrs)."""
+    return {
+        'type': response.get('violationType', 'UNKNOWN'),
+        'action': action,
+        'category': response.get('category'),
+        'confidence': response.get('confidence', 1.0)  # Default to 1.0 if absent
+    }
 
 
 def invoke_agent_with_guardrails(
@@ -37,37 +85,37 @@ def invoke_agent_with_guardrails(
         Agent response or graceful degradation if blocked
     """
     
-    guardrail_id = os.environ.get('GUARDRAIL_ID')
+    guardrail_id = GUARDRAIL_ID
     if not guardrail_id:
         print("WARNING: GUARDRAIL_ID not set - proceeding without guardrails")
         # Proceed without guardrails if not configured
         return _invoke_agent_without_guardrails(agent_id, input_data, state)
     
+    incident_id = state.get("incidentId", "unknown")
+    execution_id = state.get("executionId", "unknown")
+    query = input_data.get("query", "")
+    
     try:
         # Invoke agent with guardrail attached
         response = bedrock_agent_runtime.invoke_agent(
             agentId=agent_id,
-            agentAliasId=os.environ.get('AGENT_ALIAS_ID', 'TSTALIASID'),
-            sessionId=state.get("executionId", "unknown"),
-            inputText=input_data.get("query", ""),
+            agentAliasId=AGENT_ALIAS_ID,
+            sessionId=execution_id,
+            inputText=query,
             guardrailIdentifier=guardrail_id,
-            guardrailVersion='1'
+            guardrailVersion=GUARDRAIL_VERSION,
+            **_MODEL_CONFIG_KWARGS
         )
         
         # Check for response-based guardrail blocks
         if response.get('guardrailAction') == 'BLOCKED':
             handle_guardrail_violation_sync(
                 agent_id=agent_id,
-                incident_id=state.get("incidentId", "unknown"),
-                execution_id=state.get("executionId", "unknown"),
+                incident_id=incident_id,
+                execution_id=execution_id,
                 trace_id=response.get('traceId', 'unknown'),
-                violation={
-                    'type': response.get('violationType', 'UNKNOWN'),
-                    'action': 'BLOCK',
-                    'category': response.get('category'),
-                    'confidence': response.get('confidence', 1.0)  # Default to 1.0 if absent
-                },
-                input_text=input_data.get("query", ""),
+                violation=_violation_from_response(response, 'BLOCK'),
+                input_text=query,
                 response=response,
                 model=response.get('model', 'unknown')
             )
@@ -79,40 +127,32 @@ def invoke_agent_with_guardrails(
                 "guardrailAction": "BLOCKED"
             }
         
-        # Check for non-blocking violations (WARN mode)
-        if 'guardrailAction' in response and response['guardrailAction'] != 'BLOCKED':
+        # Check for non-blocking violations (WARN mode). Only a reported
+        # violation is logged; a clean pass-through action is not.
+        if response.get('violationType') or response.get('guardrailAction') in WARN_GUARDRAIL_ACTIONS:
             handle_guardrail_violation_sync(
                 agent_id=agent_id,
-                incident_id=state.get("incidentId", "unknown"),
-                execution_id=state.get("executionId", "unknown"),
+                incident_id=incident_id,
+                execution_id=execution_id,
                 trace_id=response.get('traceId', 'unknown'),
-                violation={
-                    'type': response.get('violationType', 'UNKNOWN'),
-                    'action': 'WARN',  # Interpret as WARN for logging
-                    'category': response.get('category'),
-                    'confidence': response.get('confidence', 1.0)  # Default to 1.0 if absent
-                },
-                input_text=input_data.get("query", ""),
+                violation=_violation_from_response(response, 'WARN'),  # Interpret as WARN for logging
+                input_text=query,
                 response=response,
                 model=response.get('model', 'unknown')
             )
         
         return response
         
-    except bedrock_agent_runtime.exceptions.GuardrailInterventionException as e:
+    except _GuardrailInterventionException as e:
         # Exception-based guardrail block
         handle_guardrail_violation_sync(
             agent_id=agent_id,
-            incident_id=state.get("incidentId", "unknown"),
-            execution_id=state.get("executionId", "unknown"),
+            incident_id=incident_id,
+            execution_id=execution_id,
             trace_id='unknown',
-            violation={
-                'type': getattr(e, 'violationType', 'UNKNOWN'),
-                'action': 'BLOCK',
-                'category': getattr(e, 'category', None),
-                'confidence': getattr(e, 'confidence', 1.0)  # Default to 1.0 if absent
-            },
-            input_text=input_data.get("query", ""),
+            # Violation details are instance attributes; snapshot them once
+            violation=_violation_from_response(getattr(e, '__dict__', None) or {}, 'BLOCK'),
+            input_text=query,
             response={'error': str(e)},
             model='unknown'
         )
@@ -154,9 +194,10 @@ def _invoke_agent_without_guardrails(
     try:
         response = bedrock_agent_runtime.invoke_agent(
             agentId=agent_id,
-            agentAliasId=os.environ.get('AGENT_ALIAS_ID', 'TSTALIASID'),
+            agentAliasId=AGENT_ALIAS_ID,
             sessionId=state.get("executionId", "unknown"),
-            inputText=input_data.get("query", "")
+            inputText=input_data.get("query", ""),
+            **_MODEL_CONFIG_KWARGS
         )
         return response
     except Exception as e:
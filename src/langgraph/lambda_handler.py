@@ -17,24 +17,81 @@ Handler Contract:
 """
 
 import json
+import logging
 import os
 import sys
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import boto3
+import orjson
+from botocore.config import Config
+
+# Checkpointing config is read when graph.py compiles the singleton graph at
+# import time, so defaults must be in place before the local imports below
+os.environ.setdefault('USE_DYNAMODB_CHECKPOINTING', 'true')
+os.environ.setdefault('LANGGRAPH_CHECKPOINT_TABLE', 'opx-langgraph-checkpoints-dev')
 
 # Local imports (Lambda bundles only src/langgraph directory)
 from graph import entry_node, graph
 from state import GraphState
+from trace_emitter import flush_trace_events
+
+
+# Full event bodies (evidence bundles) are only logged at DEBUG; serializing
+# them costs CPU and billed CloudWatch Logs ingestion on every invocation
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+DEBUG_LOGGING = LOG_LEVEL == 'DEBUG'
+
+# Library modules (agent_node etc.) do not set their own logger levels
+logging.getLogger().setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+
+
+# Datetimes and dataclasses pass through to default=str, as with json.dumps
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string (orjson)."""
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
 
 
 # ============================================================================
 # CLOUDWATCH METRICS CLIENT
 # ============================================================================
 
-cloudwatch = boto3.client('cloudwatch', region_name=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'))
+# Keep-alive so the metrics socket survives idle gaps between warm
+# invocations; a single sender thread needs only a small pool
+CLOUDWATCH_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'max_attempts': 2, 'mode': 'standard'},
+)
+cloudwatch = boto3.client(
+    'cloudwatch',
+    region_name=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+    config=CLOUDWATCH_CLIENT_CONFIG,
+)
+
+# PutMetricData accepts at most 1000 MetricData entries per call
+MAX_METRICS_PER_CALL = 1000
+
+# Metrics buffered during one invocation; sent by flush_metrics()
+_metric_buffer: List[Dict[str, Any]] = []
+
+# Single background sender, so PutMetricData overlaps the trace flush. The
+# handler then waits up to METRICS_FLUSH_TIMEOUT_SECONDS for it; a send still
+# in flight after that finishes on the next thaw, or is lost if the
+# container is retired.
+_metric_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='metrics')
+METRICS_FLUSH_TIMEOUT_SECONDS = 2.0
 
 
 def emit_metric(
@@ -44,7 +101,7 @@ def emit_metric(
     dimensions: Dict[str, str] = None,
 ) -> None:
     """
-    Emit CloudWatch metric.
+    Buffer CloudWatch metric (sent by flush_metrics()).
     
     Args:
         metric_name: Metric name (e.g., 'Execution.Count')
@@ -52,32 +109,89 @@ def emit_metric(
         unit: CloudWatch unit (None, Count, Milliseconds, etc.)
         dimensions: Metric dimensions
     """
+    metric_data = {
+        'MetricName': metric_name,
+        'Value': value,
+        'Unit': unit,
+        'Timestamp': datetime.utcnow(),
+    }
+    
+    if dimensions:
+        metric_data['Dimensions'] = [
+            {'Name': k, 'Value': v}
+            for k, v in dimensions.items()
+        ]
+    
+    _metric_buffer.append(metric_data)
+
+
+def _put_metrics(metrics: List[Dict[str, Any]]) -> None:
+    """
+    Send metrics in as few PutMetricData calls as possible. Never raises.
+    
+    Args:
+        metrics: MetricData entries
+    """
+    for i in range(0, len(metrics), MAX_METRICS_PER_CALL):
+        batch = metrics[i:i + MAX_METRICS_PER_CALL]
+        try:
+            cloudwatch.put_metric_data(
+                Namespace='Phase6',
+                MetricData=batch,
+            )
+        except Exception as e:
+            names = ', '.join(m['MetricName'] for m in batch)
+            print(f"[WARN] Failed to emit metrics {names}: {e}")
+
+
+def flush_metrics() -> Optional[Future]:
+    """
+    Hand buffered metrics to the background sender.
+    
+    Callers overlap other work with the send, then wait on the returned
+    Future (see wait_for_metrics). Never raises; metric emission must not
+    fail the handler.
+    
+    Returns:
+        Future of the send, or None if nothing was buffered
+    """
+    if not _metric_buffer:
+        return None
+    
+    metrics = _metric_buffer[:]
+    _metric_buffer.clear()
+    
+    try:
+        return _metric_pool.submit(_put_metrics, metrics)
+    except RuntimeError as e:  # Pool shut down (interpreter exit)
+        print(f"[WARN] Failed to emit {len(metrics)} metrics: {e}")
+        return None
+
+
+def wait_for_metrics(future: Optional[Future]) -> None:
+    """
+    Wait (bounded) for a send started by flush_metrics. Never raises.
+    
+    Args:
+        future: Future from flush_metrics (None if nothing was sent)
+    """
+    if future is None:
+        return
     try:
-        metric_data = {
-            'MetricName': metric_name,
-            'Value': value,
-            'Unit': unit,
-            'Timestamp': datetime.utcnow(),
-        }
-        
-        if dimensions:
-            metric_data['Dimensions'] = [
-                {'Name': k, 'Value': v}
-                for k, v in dimensions.items()
-            ]
-        
-        cloudwatch.put_metric_data(
-            Namespace='Phase6',
-            MetricData=[metric_data],
-        )
-    except Exception as e:
-        print(f"[WARN] Failed to emit metric {metric_name}: {e}")
+        future.result(timeout=METRICS_FLUSH_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        print(f"[WARN] Metrics still sending after {METRICS_FLUSH_TIMEOUT_SECONDS}s; "
+              f"left to finish in the background")
 
 
 # ============================================================================
 # INPUT VALIDATION
 # ============================================================================
 
+# Required EventBridge detail fields, checked in order
+REQUIRED_DETAIL_FIELDS = ('incident_id', 'evidence_bundle')
+
+
 def validate_event(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate EventBridge event schema.
@@ -95,11 +209,13 @@ def validate_event(event: Dict[str, Any]) -> Dict[str, Any]:
     detail = event.get('detail', {})
     
     # Required fields
-    if not detail.get('incident_id'):
-        raise ValueError("incident_id is required in event.detail")
+    for field in REQUIRED_DETAIL_FIELDS:
+        if not detail.get(field):
+            raise ValueError(f"{field} is required in event.detail")
     
-    if not detail.get('evidence_bundle'):
-        raise ValueError("evidence_bundle is required in event.detail")
+    # One clock read so generated ids and timestamp agree
+    now = datetime.utcnow()
+    now_ts = now.timestamp()
     
     # Optional fields with defaults
     if 'budget_remaining' not in detail:
@@ -107,14 +223,14 @@ def validate_event(event: Dict[str, Any]) -> Dict[str, Any]:
     
     if 'session_id' not in detail:
         # Generate session_id from incident_id + timestamp
-        detail['session_id'] = f"{detail['incident_id']}-{datetime.utcnow().timestamp()}"
+        detail['session_id'] = f"{detail['incident_id']}-{now_ts}"
     
     if 'execution_id' not in detail:
         # Generate execution_id (idempotent)
-        detail['execution_id'] = f"exec-{detail['incident_id']}-{datetime.utcnow().timestamp()}"
+        detail['execution_id'] = f"exec-{detail['incident_id']}-{now_ts}"
     
     if 'timestamp' not in detail:
-        detail['timestamp'] = datetime.utcnow().isoformat()
+        detail['timestamp'] = now.isoformat()
     
     return detail
 
@@ -138,13 +254,13 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     NEVER raises unhandled exceptions.
     """
-    start_time = datetime.utcnow()
+    # Durations use the monotonic clock (immune to wall-clock adjustments)
+    start_mono = time.monotonic()
     incident_id = None
     execution_id = None
     
     try:
-        print(f"[INFO] Lambda invoked at {start_time.isoformat()}")
-        print(f"[INFO] Event: {json.dumps(event, default=str)}")
+        print(f"[INFO] Lambda invoked at {datetime.utcnow().isoformat()}")
         
         # ====================================================================
         # STEP 1: VALIDATE INPUT
@@ -157,6 +273,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             print(f"[INFO] Validated input for incident: {incident_id}")
             print(f"[INFO] Execution ID: {execution_id}")
+            
+            # Logged only once validated: malformed (possibly oversized)
+            # events are rejected without paying to serialize them
+            if DEBUG_LOGGING:
+                print(f"[DEBUG] Event: {_dumps(event)}")
         
         except ValueError as e:
             print(f"[ERROR] Input validation failed: {e}")
@@ -164,7 +285,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             return {
                 'statusCode': 400,
-                'body': json.dumps({
+                'body': _dumps({
                     'error': 'INPUT_VALIDATION_FAILED',
                     'message': str(e),
                     'timestamp': datetime.utcnow().isoformat(),
@@ -187,7 +308,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             return {
                 'statusCode': 500,
-                'body': json.dumps({
+                'body': _dumps({
                     'error': 'STATE_CREATION_FAILED',
                     'message': str(e),
                     'incident_id': incident_id,
@@ -202,10 +323,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         try:
             print(f"[INFO] Invoking LangGraph with DynamoDB checkpointing...")
             
-            # Set environment variable for DynamoDB checkpointing
-            os.environ['USE_DYNAMODB_CHECKPOINTING'] = 'true'
-            os.environ['LANGGRAPH_CHECKPOINT_TABLE'] = 'opx-langgraph-checkpoints-dev'
-            
             # Invoke graph with checkpointing
             result = graph.invoke(
                 initial_state,
@@ -225,7 +342,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             return {
                 'statusCode': 500,
-                'body': json.dumps({
+                'body': _dumps({
                     'error': 'GRAPH_EXECUTION_FAILED',
                     'message': str(e),
                     'incident_id': incident_id,
@@ -238,8 +355,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # STEP 4: EMIT METRICS
         # ====================================================================
         
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.monotonic() - start_mono) * 1000)
+        end_iso = datetime.utcnow().isoformat()
         
         emit_metric('Execution.Count', 1, 'Count')
         emit_metric('Execution.DurationMs', duration_ms, 'Milliseconds')
@@ -268,14 +385,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': _dumps({
                 'incident_id': result.get('incident_id'),
                 'execution_id': execution_id,
                 'recommendation': result.get('recommendation'),
                 'cost': result.get('cost'),
                 'execution_summary': result.get('execution_summary'),
-                'timestamp': end_time.isoformat(),
-            }, default=str),
+                'timestamp': end_iso,
+            }),
         }
     
     except Exception as e:
@@ -290,7 +407,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': _dumps({
                 'error': 'UNHANDLED_EXCEPTION',
                 'message': str(e),
                 'incident_id': incident_id,
@@ -298,6 +415,49 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'timestamp': datetime.utcnow().isoformat(),
             }),
         }
+    
+    finally:
+        # One PutMetricData call for every metric this invocation emitted;
+        # sent in the background, overlapping the trace flush below
+        metrics_sent = flush_metrics()
+        
+        # Deliver queued LLM trace events before Lambda freezes the
+        # environment (the emitter's worker thread does not run while frozen)
+        flush_trace_events()
+        
+        # Same for the metrics send (bounded, so CloudWatch cannot hold the
+        # response)
+        wait_for_metrics(metrics_sent)
+
+
+# ============================================================================
+# INIT-TIME WARMUP
+# ============================================================================
+
+def _warmup() -> None:
+    """
+    Pull lazy one-time setup into the init phase.
+    
+    graph (and its checkpointer) and the AWS clients are already built at
+    import; this covers what would otherwise happen on the first request.
+    With SnapStart or provisioned concurrency the work is captured in the
+    snapshot / pre-initialized environment instead of a caller's latency.
+    
+    Best-effort: a warmup failure is logged and never fails module import.
+    """
+    try:
+        # Client exception classes are generated from the service model on
+        # first access
+        cloudwatch.exceptions
+        # Start the metrics sender thread now rather than on the first flush
+        _metric_pool.submit(int).result()
+        # Exercise the response serializer (incl. the default=str path)
+        _dumps({'warmup': datetime.utcnow()})
+    except Exception as e:
+        print(f"[WARN] Warmup failed: {e}")
+
+
+_warmup()
 
 
 # ============================================================================
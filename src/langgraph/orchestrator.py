@@ -7,13 +7,29 @@ AWS Lambda handler for LangGraph multi-agent orchestration.
 import json
 import os
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .graph import build_graph
 from .state import create_initial_state
 from .checkpointing import create_dynamodb_checkpointer
 
 
+# Built on first invocation, then reused across warm invocations so the
+# DynamoDB client and compiled graph are not recreated per event.
+_graph: Optional[Any] = None
+
+
+def get_graph() -> Any:
+    """Return the checkpointed orchestration graph (cached)."""
+    global _graph
+    if _graph is None:
+        checkpointer = create_dynamodb_checkpointer(
+            table_name=os.environ.get('LANGGRAPH_STATE_TABLE', 'opx-langgraph-state'),
+        )
+        _graph = build_graph(checkpointer=checkpointer)
+    return _graph
+
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler for LangGraph orchestration.
@@ -54,13 +70,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             budget_limit=budget_limit,
         )
         
-        # Create checkpointer
-        checkpointer = create_dynamodb_checkpointer(
-            table_name=os.environ.get('LANGGRAPH_STATE_TABLE', 'opx-langgraph-state'),
-        )
-        
-        # Build graph with checkpointer
-        graph = build_graph(checkpointer=checkpointer)
+        # Graph with DynamoDB checkpointer (shared across warm invocations)
+        graph = get_graph()
         
         # Execute graph
         config = {'configurable': {'thread_id': thread_id}}
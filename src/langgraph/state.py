@@ -12,7 +12,8 @@ CRITICAL RULES:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, TypedDict
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, TypedDict
 from typing_extensions import NotRequired
 
 
@@ -31,7 +32,7 @@ JSONValue = JSONScalar | List["JSONValue"] | Dict[str, "JSONValue"]
 # AGENT INPUT
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentInput:
     """
     Canonical agent input envelope.
@@ -57,6 +58,26 @@ class AgentInput:
     replay_metadata: Optional[Dict[str, JSONValue]] = None
 
 
+# ============================================================================
+# RECOMMENDATION
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """
+    Normalized entry of an agent's findings["recommendations"].
+    
+    Derived from AgentOutput.findings (see AgentOutput.recommendations);
+    never stored in state or checkpoints.
+    
+    Fields:
+        type: Action type (e.g., "ROLLBACK"), None if absent
+        description: Recommendation text, None if absent
+    """
+    type: Optional[JSONValue]
+    description: Optional[JSONValue]
+
+
 # ============================================================================
 # AGENT OUTPUT
 # ============================================================================
@@ -98,13 +119,30 @@ class AgentOutput:
     cost: Dict[str, JSONValue]
     error: Optional[Dict[str, JSONValue]]
     replay_metadata: Dict[str, JSONValue]
+    
+    @cached_property
+    def recommendations(self) -> Tuple[Recommendation, ...]:
+        """
+        findings["recommendations"] normalized once per output.
+        
+        Non-dict entries and entries with neither type nor description are
+        dropped. Not a dataclass field, so serialization is unchanged.
+        """
+        recs = self.findings.get("recommendations")
+        if not isinstance(recs, list):
+            return ()
+        return tuple(
+            Recommendation(type=rec.get("type"), description=rec.get("description"))
+            for rec in recs
+            if isinstance(rec, dict) and ("type" in rec or "description" in rec)
+        )
 
 
 # ============================================================================
 # CONSENSUS RESULT
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConsensusResult:
     """
     Consensus node output.
@@ -258,12 +296,12 @@ class GraphState(TypedDict):
     # ========================================================================
     budget_remaining: float  # USD, single source of truth
     retry_count: Dict[str, int]  # Key = agent_id
-    execution_trace: List[ExecutionTraceEntry]
+    execution_trace: Tuple[ExecutionTraceEntry, ...]  # Append-only tuple
     
     # ========================================================================
     # ERROR TRACKING
     # ========================================================================
-    errors: List[StructuredError]
+    errors: Tuple[StructuredError, ...]  # Append-only tuple
     
     # ========================================================================
     # REPLAY METADATA
@@ -276,6 +314,20 @@ class GraphState(TypedDict):
 # STATE FACTORY
 # ============================================================================
 
+# Key order of a fresh GraphState; the empty (immutable) trace and error
+# tuples are shared, everything else is filled in per state
+_INITIAL_STATE_TEMPLATE = {
+    "agent_input": None,
+    "hypotheses": None,
+    "budget_remaining": None,
+    "retry_count": None,
+    "execution_trace": (),
+    "errors": (),
+    "session_id": None,
+    "start_timestamp": None,
+}
+
+
 def create_initial_state(
     incident_id: str,
     evidence_bundle: Dict[str, JSONValue],
@@ -312,13 +364,11 @@ def create_initial_state(
         replay_metadata=replay_metadata,
     )
     
-    return GraphState(
-        agent_input=agent_input,
-        hypotheses={},
-        budget_remaining=budget_remaining,
-        retry_count={},
-        execution_trace=[],
-        errors=[],
-        session_id=session_id,
-        start_timestamp=timestamp,
-    )
+    state = _INITIAL_STATE_TEMPLATE.copy()
+    state["agent_input"] = agent_input
+    state["hypotheses"] = {}  # Fresh per state (never share mutable maps)
+    state["budget_remaining"] = budget_remaining
+    state["retry_count"] = {}
+    state["session_id"] = session_id
+    state["start_timestamp"] = timestamp
+    return state
@@ -0,0 +1,89 @@
+"""
+Consensus Node Tests
+
+Regression tests for consensus_node numeric determinism.
+"""
+
+import random
+
+from .consensus_node import DEFAULT_AGENT_WEIGHT, aggregate_confidence
+from .state import AgentOutput
+
+
+AGENT_IDS = [
+    "signal-intelligence",
+    "historical-pattern",
+    "change-intelligence",
+    "risk-blast-radius",
+    "knowledge-rag",
+    "response-strategy",
+]
+
+
+def make_output(agent_id: str, confidence: float) -> AgentOutput:
+    """Minimal successful AgentOutput with the given confidence."""
+    return AgentOutput(
+        agent_id=agent_id,
+        agent_version="1.0.0",
+        execution_id="exec-consensus-001",
+        timestamp="2024-01-26T12:00:00",
+        duration=0,
+        status="SUCCESS",
+        confidence=confidence,
+        reasoning="test",
+        disclaimer="HYPOTHESIS_ONLY_NOT_AUTHORITATIVE",
+        findings={},
+        citations=None,
+        cost={"inputTokens": 0, "outputTokens": 0, "estimatedCost": 0.0, "model": "N/A"},
+        error=None,
+        replay_metadata={"deterministicHash": "test", "schemaVersion": "1.0.0"},
+    )
+
+
+def left_to_right_aggregate(hypotheses, agent_weights) -> float:
+    """Reference: the original running-total loop, one += per agent."""
+    total_weighted_confidence = 0.0
+    total_weight = 0.0
+    for agent_id, output in hypotheses.items():
+        weight = agent_weights.get(agent_id, DEFAULT_AGENT_WEIGHT)
+        total_weighted_confidence += output.confidence * weight
+        total_weight += weight
+    if total_weight == 0.0:
+        return 0.0
+    return total_weighted_confidence / total_weight
+
+
+class TestAggregateConfidence:
+    """Tests for aggregate_confidence"""
+
+    def test_bit_identical_to_left_to_right_accumulation(self):
+        """
+        Must match the running-total loop exactly, including on Python 3.12+
+        where builtin sum() of floats uses compensated summation.
+        """
+        rng = random.Random(20240126)
+
+        for _ in range(2000):
+            agent_ids = rng.sample(AGENT_IDS, rng.randint(1, len(AGENT_IDS)))
+            hypotheses = {
+                agent_id: make_output(agent_id, rng.random())
+                for agent_id in agent_ids
+            }
+            # Some agents fall back to DEFAULT_AGENT_WEIGHT
+            agent_weights = {
+                agent_id: rng.random()
+                for agent_id in agent_ids
+                if rng.random() < 0.8
+            }
+
+            expected = left_to_right_aggregate(hypotheses, agent_weights)
+            assert aggregate_confidence(hypotheses, agent_weights) == expected
+
+    def test_no_hypotheses(self):
+        """Should return 0.0 without agents"""
+        assert aggregate_confidence({}, {}) == 0.0
+
+    def test_zero_total_weight(self):
+        """Should return 0.0 when every weight is zero"""
+        hypotheses = {"signal-intelligence": make_output("signal-intelligence", 0.9)}
+        assert aggregate_confidence(hypotheses, {"signal-intelligence": 0.0}) == 0.0
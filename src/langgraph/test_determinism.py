@@ -13,11 +13,15 @@ CRITICAL VALIDATIONS:
 """
 
 import pytest
-import json
 import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
+
+import orjson
+
 from graph import graph, entry_node
+from agent_node import create_failure_hypothesis, extract_cost_metadata
 from state import GraphState
 
 
@@ -25,31 +29,37 @@ from state import GraphState
 # TEST FIXTURES
 # ============================================================================
 
-@pytest.fixture
-def sample_incident_event() -> Dict[str, Any]:
+# Fixed event clock; ISO strings are formatted once at import
+BASE_TIME = datetime(2024, 1, 26, 12, 0, 0)
+BASE_ISO = BASE_TIME.isoformat()
+BASE_PLUS_1S_ISO = (BASE_TIME + timedelta(seconds=1)).isoformat()
+BASE_PLUS_30S_ISO = (BASE_TIME + timedelta(seconds=30)).isoformat()
+BASE_PLUS_60S_ISO = (BASE_TIME + timedelta(seconds=60)).isoformat()
+BASE_MINUS_1H_ISO = (BASE_TIME - timedelta(hours=1)).isoformat()
+
+
+def _build_sample_event() -> Dict[str, Any]:
     """
     Create a deterministic test incident event.
     """
-    base_time = datetime(2024, 1, 26, 12, 0, 0)
-    
     return {
         'incident_id': 'INC-DETERMINISM-TEST-001',
         'session_id': 'session-determinism-001',
         'execution_id': 'exec-determinism-001',
-        'timestamp': base_time.isoformat(),
+        'timestamp': BASE_ISO,
         'evidence_bundle': {
             'signals': [
                 {
                     'type': 'metric',
                     'name': 'CPUUtilization',
                     'value': 95.5,
-                    'timestamp': base_time.isoformat(),
+                    'timestamp': BASE_ISO,
                     'source': 'cloudwatch',
                 },
                 {
                     'type': 'log',
                     'message': 'ERROR: Connection timeout',
-                    'timestamp': (base_time + timedelta(seconds=30)).isoformat(),
+                    'timestamp': BASE_PLUS_30S_ISO,
                     'source': 'cloudwatch-logs',
                 },
                 {
@@ -57,7 +67,7 @@ def sample_incident_event() -> Dict[str, Any]:
                     'trace_id': '1-abc-123',
                     'duration_ms': 5000,
                     'has_error': True,
-                    'timestamp': (base_time + timedelta(seconds=60)).isoformat(),
+                    'timestamp': BASE_PLUS_60S_ISO,
                     'source': 'xray',
                 },
             ],
@@ -68,17 +78,41 @@ def sample_incident_event() -> Dict[str, Any]:
             },
         },
         'budget_remaining': 5.0,
-        'start_time': (base_time - timedelta(hours=1)).isoformat(),
-        'end_time': base_time.isoformat(),
+        'start_time': BASE_MINUS_1H_ISO,
+        'end_time': BASE_ISO,
     }
 
 
+# Built once and shared read-only; tests that need a variant copy it.
+# Only the top level is a proxy: entry_node requires evidence_bundle be a dict.
+_SAMPLE_EVENT = MappingProxyType(_build_sample_event())
+
+
+@pytest.fixture(scope='module')
+def sample_incident_event() -> Mapping[str, Any]:
+    """
+    Shared, read-only deterministic test incident event.
+    """
+    return _SAMPLE_EVENT
+
+
+# Sorted keys keep the encoding canonical across runs
+CANONICAL_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _canonical(data: Any) -> bytes:
+    """
+    Canonical JSON encoding (sorted keys) used as the hash input.
+    """
+    return orjson.dumps(data, default=str, option=CANONICAL_JSON_OPTIONS)
+
+
 def compute_deterministic_hash(data: Any) -> str:
     """
     Compute deterministic hash of data structure.
     """
-    json_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(json_str.encode()).hexdigest()
+    # Equality fingerprint only, not a security boundary
+    return hashlib.sha256(_canonical(data), usedforsecurity=False).hexdigest()
 
 
 def simulate_agent_failure(
@@ -86,23 +120,163 @@ def simulate_agent_failure(
     failing_agents: List[str],
 ) -> GraphState:
     """
-    Simulate agent failures by marking hypotheses as failed.
+    Simulate agent failures by seeding FAILURE hypotheses.
+    
+    The parallel agents node skips agents that already have a hypothesis,
+    so seeded failures reach consensus exactly as real failures would.
     
     Args:
-        state: Current graph state
+        state: Initial graph state (from entry_node)
         failing_agents: List of agent IDs to fail
     
     Returns:
-        Modified state with failed agents
+        New state with failed agents (input state is not mutated)
+    """
+    agent_input = state['agent_input']
+    
+    return {
+        **state,
+        'hypotheses': {
+            **state['hypotheses'],
+            **{
+                agent_id: create_failure_hypothesis(
+                    agent_id=agent_id,
+                    agent_version='1.0.0',
+                    execution_id=agent_input.execution_id,
+                    error_code='INTERNAL_ERROR',
+                    message='Simulated agent failure',
+                    retryable=False,
+                    retry_attempt=0,
+                    cost=extract_cost_metadata(None, 'INTERNAL_ERROR'),
+                    timestamp=agent_input.timestamp,
+                )
+                for agent_id in failing_agents
+            },
+        },
+    }
+
+
+# Canonical encoding per event object, keyed by id(). The event is stored
+# alongside so the id cannot be reused while the entry is cached.
+_EVENT_CANONICAL: Dict[int, Tuple[Mapping[str, Any], bytes]] = {}
+
+
+def event_canonical(event: Mapping[str, Any]) -> bytes:
+    """
+    Canonical encoding of a (read-only) event, serialized once.
+    
+    The evidence bundle dominates the encoding and never changes, so
+    scenario keys reuse the blob instead of re-encoding it per run.
+    """
+    cached = _EVENT_CANONICAL.get(id(event))
+    if cached is None or cached[0] is not event:
+        cached = (event, _canonical(dict(event)))
+        _EVENT_CANONICAL[id(event)] = cached
+    return cached[1]
+
+
+def scenario_key(
+    event: Mapping[str, Any],
+    failing_agents: List[str],
+) -> str:
     """
-    # Mark specified agents as failed
-    for hypothesis in state.get('agent_hypotheses', []):
-        if hypothesis.get('agent_id') in failing_agents:
-            hypothesis['status'] = 'FAILED'
-            hypothesis['confidence'] = 0.0
-            hypothesis['error'] = 'Simulated agent failure'
+    Deterministic cache key for an event + failing agents scenario.
+    """
+    return hashlib.sha256(
+        event_canonical(event) + _canonical(sorted(failing_agents)),
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+# Initial state per scenario, built once by entry_node. AgentInput and the
+# trace/error tuples are immutable and shared between runs; the mutable
+# maps are re-allocated for every run.
+_INITIAL_STATES: Dict[str, GraphState] = {}
+
+
+def initial_state_for(
+    event: Mapping[str, Any],
+    failing_agents: List[str],
+) -> GraphState:
+    """
+    Return a fresh initial state for a scenario.
+    """
+    key = scenario_key(event, failing_agents)
+    base_state = _INITIAL_STATES.get(key)
+    if base_state is None:
+        base_state = simulate_agent_failure(entry_node(event), failing_agents)
+        _INITIAL_STATES[key] = base_state
+    
+    return {
+        **base_state,
+        'hypotheses': dict(base_state['hypotheses']),
+        'retry_count': dict(base_state['retry_count']),
+    }
+
+
+def run_scenario(
+    event: Mapping[str, Any],
+    failing_agents: List[str],
+    thread_id: str,
+) -> GraphState:
+    """
+    Execute the graph once for an event with simulated agent failures.
+    """
+    return graph.invoke(
+        initial_state_for(event, failing_agents),
+        config={
+            'configurable': {
+                'thread_id': thread_id,
+            },
+        },
+    )
+
+
+# Golden (first) execution per scenario, keyed by event + failing agents.
+# Tests sharing a scenario reuse it; each test still performs its own
+# replay execution and compares against it.
+_GOLDEN_RUNS: Dict[str, GraphState] = {}
+
+
+def golden_runs(
+    event: Mapping[str, Any],
+    failure_sets: List[List[str]],
+) -> List[GraphState]:
+    """
+    Return the memoized golden executions for several scenarios.
     
-    return state
+    Scenarios not yet cached run concurrently in one graph.batch call
+    (they are independent and I/O-bound on agent invocations).
+    """
+    keys = [scenario_key(event, failing_agents) for failing_agents in failure_sets]
+    
+    missing = {}
+    for key, failing_agents in zip(keys, failure_sets):
+        if key not in _GOLDEN_RUNS:
+            missing.setdefault(key, failing_agents)
+    
+    if missing:
+        states = [
+            initial_state_for(event, failing_agents)
+            for failing_agents in missing.values()
+        ]
+        configs = [
+            {'configurable': {'thread_id': f'golden-{key[:16]}'}}
+            for key in missing
+        ]
+        _GOLDEN_RUNS.update(zip(missing, graph.batch(states, config=configs)))
+    
+    return [_GOLDEN_RUNS[key] for key in keys]
+
+
+def golden_run(
+    event: Mapping[str, Any],
+    failing_agents: List[str],
+) -> GraphState:
+    """
+    Return the memoized golden execution for a scenario.
+    """
+    return golden_runs(event, [failing_agents])[0]
 
 
 # ============================================================================
@@ -120,35 +294,15 @@ def test_determinism_with_single_agent_failure(sample_incident_event):
     """
     failing_agents = ['signal-intelligence']
     
-    # First execution with failure
-    initial_state_1 = entry_node(sample_incident_event)
-    initial_state_1 = simulate_agent_failure(initial_state_1, failing_agents)
-    
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'single-failure-test-1',
-            },
-        },
-    )
+    # First execution with failure (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event, failing_agents)
     
     consensus_1 = final_state_1.get('recommendation', {})
     confidence_1 = final_state_1.get('confidence', 0.0)
     hash_1 = compute_deterministic_hash(consensus_1)
     
     # Second execution with same failure (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    initial_state_2 = simulate_agent_failure(initial_state_2, failing_agents)
-    
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'single-failure-test-2',
-            },
-        },
-    )
+    final_state_2 = run_scenario(sample_incident_event, failing_agents, 'single-failure-test-2')
     
     consensus_2 = final_state_2.get('recommendation', {})
     confidence_2 = final_state_2.get('confidence', 0.0)
@@ -179,34 +333,14 @@ def test_determinism_with_multiple_agent_failures(sample_incident_event):
     """
     failing_agents = ['signal-intelligence', 'historical-pattern']
     
-    # First execution with failures
-    initial_state_1 = entry_node(sample_incident_event)
-    initial_state_1 = simulate_agent_failure(initial_state_1, failing_agents)
-    
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'multi-failure-test-1',
-            },
-        },
-    )
+    # First execution with failures (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event, failing_agents)
     
     consensus_1 = final_state_1.get('recommendation', {})
     hash_1 = compute_deterministic_hash(consensus_1)
     
     # Second execution with same failures (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    initial_state_2 = simulate_agent_failure(initial_state_2, failing_agents)
-    
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'multi-failure-test-2',
-            },
-        },
-    )
+    final_state_2 = run_scenario(sample_incident_event, failing_agents, 'multi-failure-test-2')
     
     consensus_2 = final_state_2.get('recommendation', {})
     hash_2 = compute_deterministic_hash(consensus_2)
@@ -232,37 +366,18 @@ def test_determinism_with_partial_data(sample_incident_event):
     - Reduced confidence but stable output
     """
     # Modify event to trigger timeouts (very short time window)
-    short_window_event = sample_incident_event.copy()
-    base_time = datetime(2024, 1, 26, 12, 0, 0)
-    short_window_event['start_time'] = base_time.isoformat()
-    short_window_event['end_time'] = (base_time + timedelta(seconds=1)).isoformat()
+    short_window_event = dict(sample_incident_event)
+    short_window_event['start_time'] = BASE_ISO
+    short_window_event['end_time'] = BASE_PLUS_1S_ISO
     
-    # First execution with partial data
-    initial_state_1 = entry_node(short_window_event)
-    
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'partial-data-test-1',
-            },
-        },
-    )
+    # First execution with partial data (golden run, shared with other tests)
+    final_state_1 = golden_run(short_window_event, [])
     
     consensus_1 = final_state_1.get('recommendation', {})
     hash_1 = compute_deterministic_hash(consensus_1)
     
     # Second execution with same partial data (replay)
-    initial_state_2 = entry_node(short_window_event)
-    
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'partial-data-test-2',
-            },
-        },
-    )
+    final_state_2 = run_scenario(short_window_event, [], 'partial-data-test-2')
     
     consensus_2 = final_state_2.get('recommendation', {})
     hash_2 = compute_deterministic_hash(consensus_2)
@@ -288,35 +403,15 @@ def test_determinism_cost_with_failures(sample_incident_event):
     """
     failing_agents = ['signal-intelligence']
     
-    # First execution with failure
-    initial_state_1 = entry_node(sample_incident_event)
-    initial_state_1 = simulate_agent_failure(initial_state_1, failing_agents)
-    
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'cost-failure-test-1',
-            },
-        },
-    )
+    # First execution with failure (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event, failing_agents)
     
     cost_1 = final_state_1.get('cost', {})
     total_cost_1 = cost_1.get('total', 0.0)
     by_agent_1 = cost_1.get('by_agent', {})
     
     # Second execution with same failure (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    initial_state_2 = simulate_agent_failure(initial_state_2, failing_agents)
-    
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'cost-failure-test-2',
-            },
-        },
-    )
+    final_state_2 = run_scenario(sample_incident_event, failing_agents, 'cost-failure-test-2')
     
     cost_2 = final_state_2.get('cost', {})
     total_cost_2 = cost_2.get('total', 0.0)
@@ -350,34 +445,14 @@ def test_determinism_execution_trace_with_failures(sample_incident_event):
     """
     failing_agents = ['signal-intelligence']
     
-    # First execution with failure
-    initial_state_1 = entry_node(sample_incident_event)
-    initial_state_1 = simulate_agent_failure(initial_state_1, failing_agents)
-    
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'trace-failure-test-1',
-            },
-        },
-    )
+    # First execution with failure (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event, failing_agents)
     
     trace_1 = final_state_1.get('execution_trace', [])
     hash_1 = compute_deterministic_hash(trace_1)
     
     # Second execution with same failure (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    initial_state_2 = simulate_agent_failure(initial_state_2, failing_agents)
-    
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'trace-failure-test-2',
-            },
-        },
-    )
+    final_state_2 = run_scenario(sample_incident_event, failing_agents, 'trace-failure-test-2')
     
     trace_2 = final_state_2.get('execution_trace', [])
     hash_2 = compute_deterministic_hash(trace_2)
@@ -413,21 +488,12 @@ def test_determinism_graceful_degradation(sample_incident_event):
     
     results = []
     
-    for failing_agents, scenario_name in failure_scenarios:
-        initial_state = entry_node(sample_incident_event)
-        
-        if failing_agents:
-            initial_state = simulate_agent_failure(initial_state, failing_agents)
-        
-        final_state = graph.invoke(
-            initial_state,
-            config={
-                'configurable': {
-                    'thread_id': f'degradation-test-{len(failing_agents)}',
-                },
-            },
-        )
-        
+    final_states = golden_runs(
+        sample_incident_event,
+        [failing_agents for failing_agents, _ in failure_scenarios],
+    )
+    
+    for (failing_agents, scenario_name), final_state in zip(failure_scenarios, final_states):
         confidence = final_state.get('confidence', 0.0)
         consensus = final_state.get('recommendation', {})
         
@@ -476,14 +542,14 @@ if __name__ == '__main__':
         'incident_id': 'INC-DETERMINISM-TEST-001',
         'session_id': 'session-determinism-001',
         'execution_id': 'exec-determinism-001',
-        'timestamp': datetime(2024, 1, 26, 12, 0, 0).isoformat(),
+        'timestamp': BASE_ISO,
         'evidence_bundle': {
             'signals': [
                 {
                     'type': 'metric',
                     'name': 'CPUUtilization',
                     'value': 95.5,
-                    'timestamp': datetime(2024, 1, 26, 12, 0, 0).isoformat(),
+                    'timestamp': BASE_ISO,
                     'source': 'cloudwatch',
                 },
             ],
@@ -493,8 +559,8 @@ if __name__ == '__main__':
             },
         },
         'budget_remaining': 5.0,
-        'start_time': datetime(2024, 1, 26, 11, 0, 0).isoformat(),
-        'end_time': datetime(2024, 1, 26, 12, 0, 0).isoformat(),
+        'start_time': BASE_MINUS_1H_ISO,
+        'end_time': BASE_ISO,
     }
     
     # Run tests
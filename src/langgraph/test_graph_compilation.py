@@ -14,19 +14,31 @@ import os
 import sys
 from datetime import datetime
 
-# Set dummy environment variables for testing
-os.environ["SIGNAL_INTELLIGENCE_AGENT_ID"] = "test-agent-1"
-os.environ["SIGNAL_INTELLIGENCE_ALIAS_ID"] = "test-alias-1"
-os.environ["HISTORICAL_PATTERN_AGENT_ID"] = "test-agent-2"
-os.environ["HISTORICAL_PATTERN_ALIAS_ID"] = "test-alias-2"
-os.environ["CHANGE_INTELLIGENCE_AGENT_ID"] = "test-agent-3"
-os.environ["CHANGE_INTELLIGENCE_ALIAS_ID"] = "test-alias-3"
-os.environ["RISK_BLAST_RADIUS_AGENT_ID"] = "test-agent-4"
-os.environ["RISK_BLAST_RADIUS_ALIAS_ID"] = "test-alias-4"
-os.environ["KNOWLEDGE_RAG_AGENT_ID"] = "test-agent-5"
-os.environ["KNOWLEDGE_RAG_ALIAS_ID"] = "test-alias-5"
-os.environ["RESPONSE_STRATEGY_AGENT_ID"] = "test-agent-6"
-os.environ["RESPONSE_STRATEGY_ALIAS_ID"] = "test-alias-6"
+import pytest
+
+# Dummy Bedrock agent/alias IDs for the six Phase 6 agents
+AGENT_ENV_PREFIXES = (
+    "SIGNAL_INTELLIGENCE",
+    "HISTORICAL_PATTERN",
+    "CHANGE_INTELLIGENCE",
+    "RISK_BLAST_RADIUS",
+    "KNOWLEDGE_RAG",
+    "RESPONSE_STRATEGY",
+)
+AGENT_ENV = {
+    f"{prefix}_{kind}_ID": f"test-{kind.lower()}-{i}"
+    for i, prefix in enumerate(AGENT_ENV_PREFIXES, 1)
+    for kind in ("AGENT", "ALIAS")
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def agent_env():
+    """Set the dummy agent IDs once per session and restore them after."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in AGENT_ENV.items():
+            mp.setenv(name, value)
+        yield
 
 
 def test_imports():
@@ -157,6 +169,8 @@ def test_state_factory():
 
 def main():
     """Run all tests."""
+    os.environ.update(AGENT_ENV)
+    
     print("=" * 60)
     print("LangGraph Compilation Verification")
     print("=" * 60)
@@ -26,11 +26,12 @@ def mock_violation_handler():
 
 @pytest.fixture
 def mock_env():
-    """Mock environment variables."""
+    """Mock environment variables (read into module constants at import)."""
     with patch.dict(os.environ, {
         'GUARDRAIL_ID': 'test-guardrail-123',
         'AGENT_ALIAS_ID': 'TSTALIASID'
-    }):
+    }), patch('guardrail_integration.GUARDRAIL_ID', 'test-guardrail-123'), \
+         patch('guardrail_integration.AGENT_ALIAS_ID', 'TSTALIASID'):
         yield
 
 
@@ -133,18 +134,20 @@ def test_response_based_block_without_confidence(mock_bedrock_agent, mock_violat
     assert call_args['violation']['confidence'] == 1.0
 
 
-def test_exception_based_block(mock_bedrock_agent, mock_violation_handler, mock_env):
+def test_exception_based_block(mock_bedrock_agent, mock_violation_handler, mock_env, monkeypatch):
     """Test exception-based guardrail block (GuardrailInterventionException)."""
     
+    class GuardrailInterventionException(Exception):
+        pass
+    
     # Mock exception
-    exception = Exception("GuardrailInterventionException")
-    exception.__class__.__name__ = 'GuardrailInterventionException'
+    exception = GuardrailInterventionException("GuardrailInterventionException")
     exception.violationType = 'PII'
     exception.category = 'SSN'
     exception.confidence = 0.99
     
     mock_bedrock_agent.invoke_agent.side_effect = exception
-    mock_bedrock_agent.exceptions.GuardrailInterventionException = type(exception)
+    monkeypatch.setattr('guardrail_integration._GuardrailInterventionException', GuardrailInterventionException)
     
     state = {
         'incidentId': 'INC-004',
@@ -202,10 +205,36 @@ def test_warn_mode_non_blocking_violation(mock_bedrock_agent, mock_violation_han
     assert not result.get('blocked')
 
 
+def test_clean_guardrail_pass_not_logged(mock_bedrock_agent, mock_violation_handler, mock_env):
+    """Test guardrail pass-through without a violation - no telemetry written."""
+    
+    mock_bedrock_agent.invoke_agent.return_value = {
+        'output': 'Clean response',
+        'guardrailAction': 'NONE',
+        'traceId': 'trace-902'
+    }
+    
+    state = {
+        'incidentId': 'INC-005',
+        'executionId': 'exec-235'
+    }
+    
+    result = invoke_agent_with_guardrails(
+        agent_id='response-strategy',
+        input_data={'query': 'Clean input'},
+        state=state
+    )
+    
+    # Verify no violation logged on the happy path
+    assert not mock_violation_handler.called
+    assert result['output'] == 'Clean response'
+
+
 def test_no_guardrail_id_fallback(mock_bedrock_agent, mock_violation_handler):
     """Test fallback when GUARDRAIL_ID not set (proceeds without guardrails)."""
     
-    with patch.dict(os.environ, {}, clear=True):
+    with patch.dict(os.environ, {}, clear=True), \
+         patch('guardrail_integration.GUARDRAIL_ID', None):
         mock_bedrock_agent.invoke_agent.return_value = {
             'output': 'Response without guardrails'
         }
@@ -13,10 +13,12 @@ CRITICAL VALIDATIONS:
 """
 
 import pytest
-import json
 import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Any
+
+import orjson
+
 from graph import graph, entry_node
 from state import GraphState
 
@@ -85,9 +87,14 @@ def compute_deterministic_hash(data: Any) -> str:
     Returns:
         SHA-256 hex digest
     """
-    # Convert to JSON with sorted keys for determinism
-    json_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(json_str.encode()).hexdigest()
+    # Canonical JSON (sorted keys) for determinism; orjson returns bytes
+    canonical = orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    # Equality fingerprint only, not a security boundary
+    return hashlib.sha256(canonical, usedforsecurity=False).hexdigest()
 
 
 def extract_consensus(state: GraphState) -> Dict[str, Any]:
@@ -139,6 +146,71 @@ def extract_execution_trace(state: GraphState) -> list:
     return state.get('execution_trace', [])
 
 
+def extract_deterministic_view(state: GraphState) -> Dict[str, Any]:
+    """
+    Extract every deterministic field of a final state in one pass.
+    
+    Same fields and defaults as the extract_* helpers above. Stays a
+    plain dict: orjson has no namedtuple encoding and would fall back
+    to str() under default=str.
+    
+    Args:
+        state: Final graph state
+    
+    Returns:
+        Incident ID, consensus, cost, trace and agent hypotheses
+    """
+    get = state.get
+    cost = get('cost', {})
+    return {
+        'incident_id': get('incident_id'),
+        'consensus': {
+            'recommendation': get('recommendation', {}),
+            'confidence': get('confidence', 0.0),
+            'agreement_score': get('agreement_score', 0.0),
+            'consensus_reached': get('consensus_reached', False),
+        },
+        'cost': {
+            'total': cost.get('total', 0.0),
+            'by_agent': cost.get('by_agent', {}),
+            'budget_remaining': cost.get('budget_remaining', 0.0),
+        },
+        'trace': get('execution_trace', []),
+        'agent_hypotheses': get('agent_hypotheses', []),
+    }
+
+
+def run_replay(event: Dict[str, Any], thread_id: str) -> GraphState:
+    """
+    Execute the graph once for an event.
+    """
+    return graph.invoke(
+        entry_node(event),
+        config={
+            'configurable': {
+                'thread_id': thread_id,
+            },
+        },
+    )
+
+
+# Golden (first) execution per event, keyed by the event hash. Every test
+# compares against it; each test still performs its own replay execution.
+_GOLDEN_RUNS: Dict[str, GraphState] = {}
+
+
+def golden_run(event: Dict[str, Any]) -> GraphState:
+    """
+    Return the memoized golden execution for an event.
+    """
+    key = compute_deterministic_hash(event)
+    final_state = _GOLDEN_RUNS.get(key)
+    if final_state is None:
+        final_state = run_replay(event, f'replay-golden-{key[:16]}')
+        _GOLDEN_RUNS[key] = final_state
+    return final_state
+
+
 # ============================================================================
 # REPLAY TESTS
 # ============================================================================
@@ -152,30 +224,14 @@ def test_replay_deterministic_consensus(sample_incident_event):
     - Confidence score identical
     - Agreement score identical
     """
-    # First execution
-    initial_state_1 = entry_node(sample_incident_event)
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'replay-test-1',
-            },
-        },
-    )
+    # First execution (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event)
     
     consensus_1 = extract_consensus(final_state_1)
     hash_1 = compute_deterministic_hash(consensus_1)
     
     # Second execution (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'replay-test-2',
-            },
-        },
-    )
+    final_state_2 = run_replay(sample_incident_event, 'replay-test-2')
     
     consensus_2 = extract_consensus(final_state_2)
     hash_2 = compute_deterministic_hash(consensus_2)
@@ -209,30 +265,14 @@ def test_replay_deterministic_cost(sample_incident_event):
     - Per-agent costs identical
     - Budget remaining identical
     """
-    # First execution
-    initial_state_1 = entry_node(sample_incident_event)
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'cost-test-1',
-            },
-        },
-    )
+    # First execution (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event)
     
     cost_1 = extract_cost(final_state_1)
     hash_1 = compute_deterministic_hash(cost_1)
     
     # Second execution (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'cost-test-2',
-            },
-        },
-    )
+    final_state_2 = run_replay(sample_incident_event, 'cost-test-2')
     
     cost_2 = extract_cost(final_state_2)
     hash_2 = compute_deterministic_hash(cost_2)
@@ -264,30 +304,14 @@ def test_replay_deterministic_trace(sample_incident_event):
     - All nodes executed
     - No extra or missing nodes
     """
-    # First execution
-    initial_state_1 = entry_node(sample_incident_event)
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'trace-test-1',
-            },
-        },
-    )
+    # First execution (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event)
     
     trace_1 = extract_execution_trace(final_state_1)
     hash_1 = compute_deterministic_hash(trace_1)
     
     # Second execution (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'trace-test-2',
-            },
-        },
-    )
+    final_state_2 = run_replay(sample_incident_event, 'trace-test-2')
     
     trace_2 = extract_execution_trace(final_state_2)
     hash_2 = compute_deterministic_hash(trace_2)
@@ -311,45 +335,17 @@ def test_replay_full_state_hash(sample_incident_event):
     - Entire final state is deterministic
     - No hidden non-determinism
     """
-    # First execution
-    initial_state_1 = entry_node(sample_incident_event)
-    final_state_1 = graph.invoke(
-        initial_state_1,
-        config={
-            'configurable': {
-                'thread_id': 'full-state-test-1',
-            },
-        },
-    )
+    # First execution (golden run, shared with other tests)
+    final_state_1 = golden_run(sample_incident_event)
     
     # Extract deterministic fields only (exclude timestamps)
-    deterministic_state_1 = {
-        'incident_id': final_state_1.get('incident_id'),
-        'consensus': extract_consensus(final_state_1),
-        'cost': extract_cost(final_state_1),
-        'trace': extract_execution_trace(final_state_1),
-        'agent_hypotheses': final_state_1.get('agent_hypotheses', []),
-    }
+    deterministic_state_1 = extract_deterministic_view(final_state_1)
     hash_1 = compute_deterministic_hash(deterministic_state_1)
     
     # Second execution (replay)
-    initial_state_2 = entry_node(sample_incident_event)
-    final_state_2 = graph.invoke(
-        initial_state_2,
-        config={
-            'configurable': {
-                'thread_id': 'full-state-test-2',
-            },
-        },
-    )
+    final_state_2 = run_replay(sample_incident_event, 'full-state-test-2')
     
-    deterministic_state_2 = {
-        'incident_id': final_state_2.get('incident_id'),
-        'consensus': extract_consensus(final_state_2),
-        'cost': extract_cost(final_state_2),
-        'trace': extract_execution_trace(final_state_2),
-        'agent_hypotheses': final_state_2.get('agent_hypotheses', []),
-    }
+    deterministic_state_2 = extract_deterministic_view(final_state_2)
     hash_2 = compute_deterministic_hash(deterministic_state_2)
     
     # CRITICAL ASSERTION
@@ -370,28 +366,14 @@ def test_replay_multiple_iterations(sample_incident_event):
     num_iterations = 5
     hashes = []
     
+    # Iteration 0 is the shared golden run; the rest execute the graph
     for i in range(num_iterations):
-        initial_state = entry_node(sample_incident_event)
-        final_state = graph.invoke(
-            initial_state,
-            config={
-                'configurable': {
-                    'thread_id': f'multi-replay-{i}',
-                },
-            },
-        )
-        
-        consensus = extract_consensus(final_state)
-        cost = extract_cost(final_state)
-        trace = extract_execution_trace(final_state)
-        
-        combined = {
-            'consensus': consensus,
-            'cost': cost,
-            'trace': trace,
-        }
+        if i == 0:
+            final_state = golden_run(sample_incident_event)
+        else:
+            final_state = run_replay(sample_incident_event, f'multi-replay-{i}')
         
-        hash_value = compute_deterministic_hash(combined)
+        hash_value = compute_deterministic_hash(extract_deterministic_view(final_state))
         hashes.append(hash_value)
     
     # CRITICAL ASSERTION: All hashes must be identical
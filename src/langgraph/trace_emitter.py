@@ -8,10 +8,17 @@ GOVERNANCE RULES (LOCKED):
 - Async, non-blocking
 - Best-effort delivery
 - No exceptions propagated
+
+DELIVERY:
+Events are queued and sent by a single background thread in PutEvents
+batches. Lambda freezes background threads between invocations, so the
+handler must call flush_trace_events() before returning.
 """
 
 import json
 import os
+import queue
+import threading
 from typing import Dict, List, Optional
 import boto3
 from botocore.exceptions import ClientError
@@ -19,6 +26,75 @@ from botocore.exceptions import ClientError
 eventbridge = boto3.client('events')
 EVENT_BUS_NAME = os.environ.get('EVENT_BUS_NAME', 'opx-control-plane')
 
+# PutEvents accepts at most 10 entries per call
+MAX_BATCH_SIZE = 10
+
+# Bounded so a stalled EventBridge can never grow memory without limit;
+# overflow drops the event (best-effort delivery)
+MAX_QUEUE_SIZE = 1000
+
+_trace_queue: "queue.Queue[Dict]" = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _put_batch(entries: List[Dict]) -> None:
+    """
+    Send one PutEvents batch. Never raises.
+    
+    Args:
+        entries: Up to MAX_BATCH_SIZE EventBridge entries
+    """
+    try:
+        response = eventbridge.put_events(Entries=entries)
+        failed = response.get('FailedEntryCount', 0)
+        if failed:
+            print(f"WARNING: {failed}/{len(entries)} trace events rejected by EventBridge")
+    except Exception as e:
+        print(f"WARNING: Failed to emit {len(entries)} trace events: {e}")
+
+
+def _drain_forever() -> None:
+    """Background worker: block for one event, then batch whatever is queued."""
+    while True:
+        batch = [_trace_queue.get()]
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                batch.append(_trace_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        _put_batch(batch)
+        
+        for _ in batch:
+            _trace_queue.task_done()
+
+
+def _ensure_worker() -> None:
+    """Start the background drain thread once per process."""
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(
+                target=_drain_forever,
+                name="trace-emitter",
+                daemon=True,
+            )
+            _worker.start()
+
+
+def flush_trace_events() -> None:
+    """
+    Block until every queued trace event has been sent (or dropped).
+    
+    Call before the Lambda handler returns; frozen environments do not
+    run the background thread between invocations.
+    """
+    if _worker is not None:
+        _trace_queue.join()
+
 
 def emit_trace_event_async(
     trace_id: str,
@@ -45,7 +121,9 @@ def emit_trace_event_async(
     capture_method: str
 ) -> None:
     """
-    Emit LLM trace event to EventBridge.
+    Queue LLM trace event for batched delivery to EventBridge.
+    
+    Returns immediately; the background worker sends the event.
     
     CRITICAL: This function NEVER raises exceptions.
     Failures are logged but not propagated.
@@ -108,16 +186,13 @@ def emit_trace_event_async(
             }
         }
         
-        eventbridge.put_events(
-            Entries=[
-                {
-                    'Source': 'opx.langgraph',
-                    'DetailType': 'LLMTraceEvent',
-                    'Detail': json.dumps(trace_event),
-                    'EventBusName': EVENT_BUS_NAME
-                }
-            ]
-        )
+        _ensure_worker()
+        _trace_queue.put_nowait({
+            'Source': 'opx.langgraph',
+            'DetailType': 'LLMTraceEvent',
+            'Detail': json.dumps(trace_event),
+            'EventBusName': EVENT_BUS_NAME
+        })
         
     except Exception as e:
         # CRITICAL: Tracing failures are logged but NOT propagated